@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Phasing:
     """
     An effect that allows passing through obstacles such as walls or other blocking entities.
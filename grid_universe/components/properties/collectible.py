@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Collectible:
     """
     Marker component for collectible entities (e.g., items that can be picked up).
@@ -3,7 +3,7 @@ from pyrsistent import PSet
 from grid_universe.types import EntityID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Inventory:
     """
     Inventory component.
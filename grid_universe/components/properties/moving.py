@@ -14,7 +14,7 @@ class MovingAxis(StrEnum):
     VERTICAL = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Moving:
     """
     Autonomous movement component.
@@ -10,7 +10,7 @@ class PathfindingType(StrEnum):
     PATH = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Pathfinding:
     """
     Pathfinding property component.
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     """
     Grid position component.
 
+    Positions are allocated on every move and used as keys throughout the
+    state, so the class uses ``__slots__`` to avoid a per-instance ``__dict__``.
+
     Attributes:
         x: X-coordinate on the grid.
         y: Y-coordinate on the grid.
@@ -13,3 +17,25 @@ class Position:
 
     x: int
     y: int
+
+    @property
+    def packed(self) -> int:
+        """
+        Both coordinates packed into one int: ``(x << 16) | (y & 0xFFFF)``.
+
+        Only ``y``'s low 16 bits are kept, so this is unique only for
+        ``0 <= y < 65536``; outside that range distinct positions can share it.
+        """
+        return (self.x << 16) | (self.y & 0xFFFF)
+
+    def __hash__(self) -> int:
+        # Same value as ``packed``, inlined: hashing an int is cheaper than the
+        # dataclass default, which builds and hashes an ``(x, y)`` tuple.
+        # Collisions for y outside 16 bits only cost speed; __eq__ stays exact.
+        return (self.x << 16) | (self.y & 0xFFFF)
+
+    @classmethod
+    def from_tuple(cls, xy: Tuple[int, int]) -> "Position":
+        """Build a position from an ``(x, y)`` pair without star-unpacking."""
+        x, y = xy
+        return cls(x, y)
@@ -18,6 +18,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from pyrsistent import pmap, pset
 
 from grid_universe.state import State
+from grid_universe.entity import EntityAllocator
 from grid_universe.types import EntityID
 from grid_universe.components.properties import (
     Position as PositionComp,
@@ -69,12 +70,11 @@ def _init_store_maps() -> Dict[str, Dict[EntityID, Any]]:
 def _alloc_from_obj(
     obj: BaseEntity,
     stores: Dict[str, Dict[EntityID, Any]],
-    next_eid_ref: List[int],
+    allocator: EntityAllocator,
     place_pos: Optional[Position] = None,
 ) -> EntityID:
     """Allocate a new EntityID, copy ECS/effect components from obj, and optionally set Position."""
-    eid: EntityID = next_eid_ref[0]
-    next_eid_ref[0] += 1
+    eid: EntityID = allocator.new()
 
     for store_name, comp in obj.iter_components():
         stores[store_name][eid] = comp
@@ -139,7 +139,7 @@ def _build_state(level: Level, stores: Dict[str, Dict[EntityID, Any]]) -> State:
 def to_state(level: Level) -> State:
     """Convert a Level (grid of BaseEntity objects) into an immutable State."""
     stores: Dict[str, Dict[EntityID, Any]] = _init_store_maps()
-    next_eid_ref: List[int] = [0]
+    allocator = EntityAllocator()
 
     # source object -> eid for on-grid objects
     obj_to_eid: Dict[int, EntityID] = {}
@@ -148,7 +148,7 @@ def to_state(level: Level) -> State:
     for y in range(level.height):
         for x in range(level.width):
             for obj in level.grid[y][x]:
-                eid = _alloc_from_obj(obj, stores, next_eid_ref, place_pos=(x, y))
+                eid = _alloc_from_obj(obj, stores, allocator, place_pos=(x, y))
                 obj_to_eid[id(obj)] = eid
                 placed.append((obj, eid))
 
@@ -161,7 +161,7 @@ def to_state(level: Level) -> State:
                 if "inventory_list" in nested_lists:
                     base_inv = stores["inventory"].get(eid, Inventory(pset()))
                     item_ids: List[EntityID] = [
-                        _alloc_from_obj(item, stores, next_eid_ref, place_pos=None)
+                        _alloc_from_obj(item, stores, allocator, place_pos=None)
                         for item in nested_lists["inventory_list"]
                     ]
                     stores["inventory"][eid] = Inventory(
@@ -172,7 +172,7 @@ def to_state(level: Level) -> State:
                 if "status_list" in nested_lists:
                     base_status = stores["status"].get(eid, Status(pset()))
                     eff_ids: List[EntityID] = [
-                        _alloc_from_obj(eff, stores, next_eid_ref, place_pos=None)
+                        _alloc_from_obj(eff, stores, allocator, place_pos=None)
                         for eff in nested_lists["status_list"]
                     ]
                     stores["status"][eid] = Status(
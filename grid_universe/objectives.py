@@ -10,17 +10,14 @@ the win condition has been met.
 from typing import Dict
 from grid_universe.state import State
 from grid_universe.types import EntityID, ObjectiveFn
-from grid_universe.utils.ecs import entities_with_components_at
+from grid_universe.utils.ecs import occupied_positions
 
 
 def exit_objective_fn(state: State, agent_id: EntityID) -> bool:
     """Agent stands on any entity possessing an ``Exit`` component."""
     if agent_id not in state.position:
         return False
-    return (
-        len(entities_with_components_at(state, state.position[agent_id], state.exit))
-        > 0
-    )
+    return state.position[agent_id] in occupied_positions(state.position, state.exit)
 
 
 def collect_objective_fn(state: State, agent_id: EntityID) -> bool:
@@ -40,17 +37,11 @@ def all_unlocked_objective_fn(state: State, agent_id: EntityID) -> bool:
 
 def all_pushable_at_exit_objective_fn(state: State, agent_id: EntityID) -> bool:
     """Every Pushable entity currently occupies an exit tile."""
+    exit_positions = occupied_positions(state.position, state.exit)
     for pushable_id in state.pushable:
         if pushable_id not in state.position:
             return False
-        if (
-            len(
-                entities_with_components_at(
-                    state, state.position[pushable_id], state.exit
-                )
-            )
-            == 0
-        ):
+        if state.position[pushable_id] not in exit_positions:
             return False
     return True
 
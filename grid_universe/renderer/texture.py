@@ -36,7 +36,7 @@ Performance Notes
 from collections import defaultdict
 from pathlib import Path
 import colorsys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from functools import lru_cache
 from typing import Callable, Dict, Optional, Tuple, List
 from PIL import Image
@@ -299,9 +299,10 @@ def get_object_renderings(
         appearance = state.appearance.get(eid, default_appearance)
         properties = tuple(
             [
-                component
-                for component, value in state.__dict__.items()
-                if isinstance(value, type(pmap())) and eid in value
+                field.name
+                for field in fields(state)
+                if isinstance(value := getattr(state, field.name), type(pmap()))
+                and eid in value
             ]
         )
 
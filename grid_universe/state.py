@@ -36,10 +36,14 @@ from grid_universe.components.properties import (
 from grid_universe.types import EntityID, MoveFn, ObjectiveFn
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class State:
     """Immutable ECS world state.
 
+    The class is slotted: every system reads several component stores per
+    tick, and slot descriptors make those lookups cheaper than a per-instance
+    ``__dict__`` while keeping ``dataclasses.replace`` semantics unchanged.
+
     Attributes:
         width (int): Grid width in tiles.
         height (int): Grid height in tiles.
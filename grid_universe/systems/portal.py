@@ -30,9 +30,11 @@ def portal_system_entity(
     if is_blocked_at(state, pair_position, check_collidable=True):
         return state  # Teleport not possible
 
-    entity_ids = set(augmented_trail.get(portal_position, pset())) & set(
-        state.collidable
-    )
+    entity_ids = {
+        eid
+        for eid in augmented_trail.get(portal_position, pset())
+        if eid in state.collidable
+    }
     entering_entity_ids = {
         eid
         for eid in entity_ids
@@ -52,5 +54,10 @@ def portal_system(state: State) -> State:
         state, pset(state.collidable)
     )
     for portal_id in state.portal:
+        # A portal can only fire if some collidable entity touched its tile
+        # this turn; the trail is keyed by position, so this is a single probe.
+        portal_position = state.position.get(portal_id)
+        if portal_position is None or portal_position not in augmented_trail:
+            continue
         state = portal_system_entity(state, augmented_trail, portal_id)
     return state
@@ -7,6 +7,7 @@ expired or orphaned effects.
 """
 
 from dataclasses import replace
+from typing import Any, Optional, Tuple
 from pyrsistent.typing import PMap, PSet
 from grid_universe.components import TimeLimit, UsageLimit, Status
 from grid_universe.state import State
@@ -19,12 +20,13 @@ def tick_time_limit(
     time_limit: PMap[EntityID, TimeLimit],
 ) -> PMap[EntityID, TimeLimit]:
     """Decrement per-effect time limits present in ``status``."""
+    # Batch the updates through an evolver so the map is path-copied once,
+    # not once per ticking effect.
+    evolver = time_limit.evolver()
     for effect_id in status.effect_ids:
         if effect_id in time_limit:
-            time_limit = time_limit.set(
-                effect_id, TimeLimit(amount=time_limit[effect_id].amount - 1)
-            )
-    return time_limit
+            evolver[effect_id] = TimeLimit(amount=time_limit[effect_id].amount - 1)
+    return evolver.persistent()
 
 
 def cleanup_effect(
@@ -42,64 +44,88 @@ def is_effect_expired(
     usage_limit: PMap[EntityID, UsageLimit],
 ) -> bool:
     """Return True if effect's time or usage limit has reached zero."""
-    if effect_id in time_limit and time_limit[effect_id].amount <= 0:
+    # One .get per map instead of a membership test followed by a lookup.
+    limit = time_limit.get(effect_id)
+    if limit is not None and limit.amount <= 0:
         return True
-    if effect_id in usage_limit and usage_limit[effect_id].amount <= 0:
+    usage = usage_limit.get(effect_id)
+    if usage is not None and usage.amount <= 0:
         return True
     return False
 
 
+def _effect_stores(state: State) -> Tuple[PMap[EntityID, Any], ...]:
+    """Return the component map for every ``EffectType``."""
+    return tuple(getattr(state, effect_type.name.lower()) for effect_type in EffectType)
+
+
 def garbage_collect(
     state: State,
     time_limit: PMap[EntityID, TimeLimit],
     usage_limit: PMap[EntityID, UsageLimit],
     status: Status,
+    effect_stores: Optional[Tuple[PMap[EntityID, Any], ...]] = None,
 ) -> Status:
-    """Remove orphaned or expired effects from status and entity maps."""
-    effect_ids: PSet[EntityID] = status.effect_ids
-
-    # Remove invalid effect_ids by checking all effect component maps using EffectType
-    for effect_id in list(effect_ids):
-        if all(
-            effect_id not in getattr(state, effect_type.name.lower())
-            for effect_type in EffectType
-        ):
-            effect_ids = cleanup_effect(effect_id, effect_ids)
+    """Remove orphaned or expired effects from status and entity maps.
 
-    # Remove expired effect_ids
-    for effect_id in list(effect_ids):
-        if is_effect_expired(effect_id, time_limit, usage_limit):
-            effect_ids = cleanup_effect(effect_id, effect_ids)
-
-    return replace(status, effect_ids=effect_ids)
+    ``effect_stores`` may be passed in by callers that collect many statuses
+    against the same state; otherwise it is resolved from ``state``.
+    """
+    effect_ids: PSet[EntityID] = status.effect_ids
+    if effect_stores is None:
+        effect_stores = _effect_stores(state)
+
+    # Single pass: an effect is dropped if no effect map holds it (orphaned)
+    # or its time/usage limit has run out.
+    stale = [
+        effect_id
+        for effect_id in effect_ids
+        if all(effect_id not in store for store in effect_stores)
+        or is_effect_expired(effect_id, time_limit, usage_limit)
+    ]
+    if not stale:
+        return status
+
+    evolver = effect_ids.evolver()
+    for effect_id in stale:
+        evolver.remove(effect_id)
+    return replace(status, effect_ids=evolver.persistent())
 
 
 def status_tick_system(state: State) -> State:
     """Phase 1: decrement all active time limits."""
-    state_status = state.status
-    state_time_limit = state.time_limit
+    # One evolver across every status: each limit is path-copied once per tick.
+    time_limit = state.time_limit
+    evolver = time_limit.evolver()
+    for entity_status in state.status.values():
+        for effect_id in entity_status.effect_ids:
+            if effect_id in time_limit:
+                evolver[effect_id] = TimeLimit(amount=evolver[effect_id].amount - 1)
+    if not evolver.is_dirty():
+        return state
 
-    for _, entity_status in state_status.items():
-        state_time_limit = tick_time_limit(state, entity_status, state_time_limit)
-
-    return replace(
-        state,
-        status=state_status,
-        time_limit=state_time_limit,
-    )
+    return replace(state, time_limit=evolver.persistent())
 
 
 def status_gc_system(state: State) -> State:
     """Phase 2: prune orphaned / expired effects from statuses and entities."""
-    state_status = state.status
+    if not state.status:
+        return state
+
     state_time_limit = state.time_limit
     state_usage_limit = state.usage_limit
 
-    for entity_id, entity_status in state_status.items():
-        entity_status = garbage_collect(
-            state, state_time_limit, state_usage_limit, entity_status
+    effect_stores = _effect_stores(state)
+    status_evolver = state.status.evolver()
+    for entity_id, entity_status in state.status.items():
+        collected = garbage_collect(
+            state, state_time_limit, state_usage_limit, entity_status, effect_stores
         )
-        state_status = state_status.set(entity_id, entity_status)
+        if collected is not entity_status:
+            status_evolver[entity_id] = collected
+    if not status_evolver.is_dirty():
+        return state
+    state_status = status_evolver.persistent()
 
     return replace(
         state,
@@ -111,6 +137,9 @@ def status_gc_system(state: State) -> State:
 
 def status_system(state: State) -> State:
     """Run tick + GC phases for all statuses (public entry point)."""
+    # Both phases only walk statuses; with none there is nothing to do.
+    if not state.status:
+        return state
     state = status_tick_system(state)
     state = status_gc_system(state)
     return state
@@ -12,7 +12,7 @@ from pyrsistent.typing import PMap
 from grid_universe.state import State
 from grid_universe.types import EntityID
 from grid_universe.components import Position, Rewardable, Cost
-from grid_universe.utils.ecs import entities_at
+from grid_universe.utils.ecs import entities_with_components_at
 from grid_universe.utils.terminal import is_terminal_state, is_valid_state
 
 
@@ -22,14 +22,21 @@ def get_noncollectible_entities(
     component_map: Union[PMap[EntityID, Rewardable], PMap[EntityID, Cost]],
 ) -> Set[EntityID]:
     """Return entity IDs at ``pos`` with a component but not collectible."""
-    at_pos = entities_at(state, pos)
-    ids = set(component_map.keys())
-    collectible_ids = set(state.collectible.keys())
-    return (at_pos & ids) - collectible_ids
+    # The cached position index answers "who is on this tile" with one dict
+    # get; only those entities are then checked against the collectible store.
+    collectible = state.collectible
+    return {
+        eid
+        for eid in entities_with_components_at(state, pos, component_map)
+        if eid not in collectible
+    }
 
 
 def tile_reward_system(state: State, eid: EntityID) -> State:
     """Increase score for rewardable non-collectible entities at agent tile."""
+    # Most levels have no reward (or cost) tiles; skip the per-step checks.
+    if not state.rewardable:
+        return state
     pos = state.position.get(eid)
     if not is_valid_state(state, eid) or is_terminal_state(state, eid) or pos is None:
         return state
@@ -44,6 +51,8 @@ def tile_reward_system(state: State, eid: EntityID) -> State:
 
 def tile_cost_system(state: State, eid: EntityID) -> State:
     """Decrease score for cost-bearing non-collectible entities at agent tile."""
+    if not state.cost:
+        return state
     pos = state.position.get(eid)
     if not is_valid_state(state, eid) or is_terminal_state(state, eid) or pos is None:
         return state
@@ -34,6 +34,27 @@ def _position_index(
     return {pos: frozenset(eids) for pos, eids in index.items()}
 
 
+@lru_cache(maxsize=4096)
+def occupied_positions(
+    position_store: Mapping[EntityID, Position],
+    component_store: Mapping[EntityID, object],
+) -> FrozenSet[Position]:
+    """Return the set of positions occupied by entities in ``component_store``.
+
+    Args:
+        position_store (Mapping[EntityID, Position]): Mapping of entity IDs to
+            positions.
+        component_store (Mapping[EntityID, object]): Component map to project
+            onto the grid.
+
+    Returns:
+        FrozenSet[Position]: Positions holding at least one entity with the component.
+    """
+    return frozenset(
+        position_store[eid] for eid in component_store if eid in position_store
+    )
+
+
 def entities_at(state: State, pos: Position) -> Set[EntityID]:
     """Return entity IDs at the given position."""
     idx = _position_index(state.position)
@@ -44,7 +65,9 @@ def entities_with_components_at(
     state: State, pos: Position, *component_stores: Mapping[EntityID, object]
 ) -> List[EntityID]:
     """Return entity IDs at ``pos`` that have all specified components."""
-    ids_at_pos: Set[EntityID] = entities_at(state, pos)
-    for store in component_stores:
-        ids_at_pos &= set(store.keys())
-    return list(ids_at_pos)
+    # Read the cached frozen index directly (no defensive copy) and probe each
+    # store per candidate: only the (few) entities on the tile are looked at.
+    ids_at_pos = _position_index(state.position).get(pos, frozenset())
+    return [
+        eid for eid in ids_at_pos if all(eid in store for store in component_stores)
+    ]
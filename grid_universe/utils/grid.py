@@ -8,11 +8,9 @@ Functions here are used by movement and pathfinding systems to validate
 entity positions and movements within the grid world.
 """
 
-from typing import Set
 from grid_universe.components import Position
 from grid_universe.state import State
-from grid_universe.types import EntityID
-from grid_universe.utils.ecs import entities_at
+from grid_universe.utils.ecs import occupied_positions
 
 
 def is_in_bounds(state: State, pos: Position) -> bool:
@@ -39,12 +37,11 @@ def is_blocked_at(
         check_collidable (bool): If True, treat ``Collidable`` as blocking (for agent movement);
             pushing may disable this to allow pushing into collidable tiles.
     """
-    ids_at_pos: Set[EntityID] = entities_at(state, pos)
-    for other_id in ids_at_pos:
-        if (
-            other_id in state.blocking
-            or (check_pushable and other_id in state.pushable)
-            or (check_collidable and other_id in state.collidable)
-        ):
-            return True
-    return False
+    # Each flag is a cached occupancy set, so a query is a few hash probes
+    # instead of a scan over the entities standing on the tile.
+    position = state.position
+    return (
+        pos in occupied_positions(position, state.blocking)
+        or (check_pushable and pos in occupied_positions(position, state.pushable))
+        or (check_collidable and pos in occupied_positions(position, state.collidable))
+    )
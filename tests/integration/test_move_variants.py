@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Tuple
 import pytest
 from grid_universe.actions import Action
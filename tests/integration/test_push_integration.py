@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Tuple, List, Dict
 from pyrsistent import pmap, pset
@@ -18,6 +20,7 @@ from grid_universe.components import (
 )
 from grid_universe.actions import Action
 from grid_universe.step import step
+from tests.test_utils import push_move_fn
 
 
 def make_push_state(
@@ -63,14 +66,7 @@ def make_push_state(
     state: State = State(
         width=width,
         height=height,
-        move_fn=lambda s, eid, dir: [
-            Position(
-                s.position[eid].x
-                + (1 if dir == Action.RIGHT else -1 if dir == Action.LEFT else 0),
-                s.position[eid].y
-                + (1 if dir == Action.DOWN else -1 if dir == Action.UP else 0),
-            )
-        ],
+        move_fn=push_move_fn,
         objective_fn=default_objective_fn,
         position=pmap(pos),
         agent=pmap(agent),
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Dict, List, Tuple
 from pyrsistent import pmap, pset, PMap
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import Tuple, Dict
 from pyrsistent.typing import PMap
 from grid_universe.objectives import default_objective_fn
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Dict, List, Tuple, Optional
 from pyrsistent import pmap, PMap, pset
@@ -1,4 +1,9 @@
+from __future__ import annotations
+
 from dataclasses import replace
+from typing import Callable, Optional, Tuple
+
+import pytest
 from pyrsistent import pmap, pset
 from pyrsistent.typing import PSet
 from grid_universe.objectives import default_objective_fn
@@ -15,9 +20,17 @@ from grid_universe.components import (
     Collidable,
     Appearance,
 )
+from tests.test_utils import EMPTY_INVENTORY, noop_move_fn
 from grid_universe.entity import new_entity_id
 
 
+# The canonical door sits at (0, 2) on a 3x3 grid; (1, 2) is an in-bounds
+# neighbour, so tests that target it can place the agent directly.
+DOOR_NEIGHBOR: Position = Position(1, 2)
+
+InventoryTweak = Callable[[State, EntityID, EntityID], Tuple[State, Optional[EntityID]]]
+
+
 def add_key_to_inventory(state: State, agent_id: EntityID, key_id: EntityID) -> State:
     inv: Inventory = state.inventory[agent_id]
     new_inv: Inventory = Inventory(item_ids=inv.item_ids.add(key_id))
@@ -25,9 +38,12 @@ def add_key_to_inventory(state: State, agent_id: EntityID, key_id: EntityID) ->
 
 
 def set_inventory(state: State, agent_id: EntityID, item_ids: PSet[EntityID]) -> State:
-    return replace(
-        state, inventory=state.inventory.set(agent_id, Inventory(item_ids=item_ids))
-    )
+    inventory = Inventory(item_ids=item_ids) if item_ids else EMPTY_INVENTORY
+    return replace(state, inventory=state.inventory.set(agent_id, inventory))
+
+
+def place_agent(state: State, agent_id: EntityID, pos: Position) -> State:
+    return replace(state, position=state.position.set(agent_id, pos))
 
 
 def move_agent_adjacent_to(
@@ -51,7 +67,6 @@ def make_minimal_key_door_state() -> tuple[State, dict]:
     agent: dict = {}
     inventory: dict = {}
     key: dict = {}
-    collectible: dict = {}
     locked: dict = {}
     blocking: dict = {}
     collidable: dict = {}
@@ -65,11 +80,8 @@ def make_minimal_key_door_state() -> tuple[State, dict]:
     pos[key_id] = Position(0, 1)
     pos[door_id] = Position(0, 2)
     agent[agent_id] = Agent()
-    inventory[agent_id] = Inventory(pset())
+    inventory[agent_id] = EMPTY_INVENTORY
     key[key_id] = Key(key_id="red")
-    collectible[key_id] = (
-        None  # Not needed for locked system, but here for completeness
-    )
     locked[door_id] = Locked(key_id="red")
     blocking[door_id] = Blocking()
     collidable[agent_id] = Collidable()
@@ -81,13 +93,12 @@ def make_minimal_key_door_state() -> tuple[State, dict]:
     state = State(
         width=3,
         height=3,
-        move_fn=lambda s, eid, d: [],
+        move_fn=noop_move_fn,
         objective_fn=default_objective_fn,
         position=pmap(pos),
         agent=pmap(agent),
         locked=pmap(locked),
         key=pmap(key),
-        collectible=pmap({k: v for k, v in collectible.items() if v is not None}),
         inventory=pmap(inventory),
         appearance=pmap(appearance),
         blocking=pmap(blocking),
@@ -97,49 +108,87 @@ def make_minimal_key_door_state() -> tuple[State, dict]:
     return state, entities
 
 
-def test_unlock_door_with_matching_key():
-    state, entities = make_minimal_key_door_state()
-    agent_id: EntityID = entities["agent_id"]
-    key_id: EntityID = entities["key_id"]
-    door_id: EntityID = entities["door_id"]
-    state = add_key_to_inventory(state, agent_id, key_id)
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
-    state = unlock_system(state, agent_id)
-    assert door_id not in state.locked
-    assert door_id not in state.blocking
-    assert key_id not in state.inventory[agent_id].item_ids
+def give_matching_key(
+    state: State, agent_id: EntityID, key_id: EntityID
+) -> Tuple[State, Optional[EntityID]]:
+    return add_key_to_inventory(state, agent_id, key_id), key_id
 
 
-def test_unlock_door_without_matching_key():
-    state, entities = make_minimal_key_door_state()
-    agent_id: EntityID = entities["agent_id"]
-    door_id: EntityID = entities["door_id"]
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
-    state = unlock_system(state, agent_id)
-    assert door_id in state.locked
+def give_nothing(
+    state: State, agent_id: EntityID, key_id: EntityID
+) -> Tuple[State, Optional[EntityID]]:
+    return state, None
 
 
-def test_unlock_door_with_wrong_key_id():
-    state, entities = make_minimal_key_door_state()
-    agent_id: EntityID = entities["agent_id"]
+def give_wrong_key(
+    state: State, agent_id: EntityID, key_id: EntityID
+) -> Tuple[State, Optional[EntityID]]:
     wrong_key_id: EntityID = new_entity_id()
     # Add a key with a different key_id
     state = replace(state, key=state.key.set(wrong_key_id, Key(key_id="wrong")))
-    state = add_key_to_inventory(state, agent_id, wrong_key_id)
+    return add_key_to_inventory(state, agent_id, wrong_key_id), wrong_key_id
+
+
+def give_unregistered_item(
+    state: State, agent_id: EntityID, key_id: EntityID
+) -> Tuple[State, Optional[EntityID]]:
+    # Item is in the inventory but has no entry in the key store
+    item_id: EntityID = new_entity_id()
+    return add_key_to_inventory(state, agent_id, item_id), item_id
+
+
+@pytest.fixture(scope="module")
+def base_state() -> Tuple[State, dict]:
+    # State is immutable, so one instance can safely back every case below.
+    return make_minimal_key_door_state()
+
+
+@pytest.mark.parametrize(
+    "inventory_tweak, target_pos, expect_locked",
+    [
+        (give_matching_key, None, False),
+        (give_nothing, None, True),
+        (give_wrong_key, None, True),
+        (give_unregistered_item, None, True),
+        (give_matching_key, Position(2, 0), True),  # no locked door nearby
+    ],
+    ids=[
+        "matching_key",
+        "without_matching_key",
+        "wrong_key_id",
+        "item_not_in_key_store",
+        "nonlocked_position",
+    ],
+)
+def test_unlock_door_with_inventory(
+    base_state: Tuple[State, dict],
+    inventory_tweak: InventoryTweak,
+    target_pos: Optional[Position],
+    expect_locked: bool,
+) -> None:
+    state, entities = base_state
+    agent_id: EntityID = entities["agent_id"]
+    key_id: EntityID = entities["key_id"]
     door_id: EntityID = entities["door_id"]
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
+    state, item_id = inventory_tweak(state, agent_id, key_id)
+    if target_pos is None:
+        state = place_agent(state, agent_id, DOOR_NEIGHBOR)
+    else:
+        state = move_agent_adjacent_to(state, agent_id, target_pos)
     state = unlock_system(state, agent_id)
-    assert door_id in state.locked
-    assert wrong_key_id in state.inventory[agent_id].item_ids
+    assert (door_id in state.locked) == expect_locked
+    assert (door_id in state.blocking) == expect_locked
+    if item_id is not None:
+        # The item is only consumed when it actually opened the door
+        assert (item_id in state.inventory[agent_id].item_ids) == expect_locked
 
 
 def test_unlock_consumes_key():
     state, entities = make_minimal_key_door_state()
     agent_id: EntityID = entities["agent_id"]
     key_id: EntityID = entities["key_id"]
-    door_id: EntityID = entities["door_id"]
     state = add_key_to_inventory(state, agent_id, key_id)
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     assert key_id not in state.inventory[agent_id].item_ids
     assert key_id not in state.key
@@ -150,7 +199,7 @@ def test_unlock_door_with_no_inventory():
     agent_id: EntityID = entities["agent_id"]
     door_id: EntityID = entities["door_id"]
     state = replace(state, inventory=state.inventory.remove(agent_id))
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     assert door_id in state.locked
 
@@ -160,7 +209,7 @@ def test_unlock_door_with_empty_inventory():
     agent_id: EntityID = entities["agent_id"]
     door_id: EntityID = entities["door_id"]
     state = set_inventory(state, agent_id, pset())
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     assert door_id in state.locked
 
@@ -185,9 +234,9 @@ def test_unlock_multiple_doors_with_enough_keys():
     state = set_inventory(
         state, agent_id, state.inventory[agent_id].item_ids.add(key_id).add(key_id2)
     )
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id1])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id2])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     assert door_id1 not in state.locked
     assert door_id2 not in state.locked
@@ -210,9 +259,9 @@ def test_unlock_multiple_doors_with_limited_keys():
     state = set_inventory(
         state, agent_id, state.inventory[agent_id].item_ids.add(key_id)
     )
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id1])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id2])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     unlocked_count: int = int(door_id1 not in state.locked) + int(
         door_id2 not in state.locked
@@ -220,53 +269,13 @@ def test_unlock_multiple_doors_with_limited_keys():
     assert unlocked_count == 1
 
 
-def test_unlock_with_key_not_in_key_store():
-    state, entities = make_minimal_key_door_state()
-    agent_id: EntityID = entities["agent_id"]
-    key_id: EntityID = new_entity_id()
-    door_id: EntityID = entities["door_id"]
-    state = set_inventory(
-        state, agent_id, state.inventory[agent_id].item_ids.add(key_id)
-    )
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
-    state = unlock_system(state, agent_id)
-    assert door_id in state.locked
-    assert key_id in state.inventory[agent_id].item_ids
-
-
-def test_unlock_with_nonkey_item_in_inventory():
-    state, entities = make_minimal_key_door_state()
-    agent_id: EntityID = entities["agent_id"]
-    nonkey_id: EntityID = new_entity_id()
-    door_id: EntityID = entities["door_id"]
-    # Add non-key item to inventory
-    state = set_inventory(
-        state, agent_id, state.inventory[agent_id].item_ids.add(nonkey_id)
-    )
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
-    state = unlock_system(state, agent_id)
-    assert door_id in state.locked
-    assert nonkey_id in state.inventory[agent_id].item_ids
-
-
-def test_unlock_at_nonlocked_position():
-    state, entities = make_minimal_key_door_state()
-    agent_id: EntityID = entities["agent_id"]
-    key_id: EntityID = entities["key_id"]
-    unused_pos: Position = Position(2, 0)  # Some position with no locked door
-    state = add_key_to_inventory(state, agent_id, key_id)
-    state = move_agent_adjacent_to(state, agent_id, unused_pos)
-    state = unlock_system(state, agent_id)
-    assert key_id in state.inventory[agent_id].item_ids
-
-
 def test_unlock_after_picking_up_key():
     state, entities = make_minimal_key_door_state()
     agent_id: EntityID = entities["agent_id"]
     key_id: EntityID = entities["key_id"]
     door_id: EntityID = entities["door_id"]
     state = add_key_to_inventory(state, agent_id, key_id)
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     assert door_id not in state.locked
     assert key_id not in state.inventory[agent_id].item_ids
@@ -293,7 +302,7 @@ def test_multi_agent_unlock_affects_only_actor():
         inventory=state.inventory.set(agent_id2, Inventory(item_ids=pset([key_id2]))),
     )
     state = add_key_to_inventory(state, agent_id1, key_id1)
-    state = move_agent_adjacent_to(state, agent_id1, state.position[door_id1])
+    state = place_agent(state, agent_id1, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id1)
     assert door_id2 in state.locked
     assert key_id2 in state.inventory[agent_id2].item_ids
@@ -319,7 +328,7 @@ def test_unlock_adjacent_to_multiple_locked():
     state = set_inventory(
         state, agent_id, state.inventory[agent_id].item_ids.add(key_id1).add(key_id2)
     )
-    state = move_agent_adjacent_to(state, agent_id, state.position[door_id1])
+    state = place_agent(state, agent_id, DOOR_NEIGHBOR)
     state = unlock_system(state, agent_id)
     unlocked_count: int = int(door_id1 not in state.locked) + int(
         door_id2 not in state.locked
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Tuple, List
 
@@ -15,7 +17,8 @@ from grid_universe.components import (
     Portal,
     Appearance,
 )
-from grid_universe.entity import new_entity_id
+from tests.test_utils import noop_move_fn
+from grid_universe.entity import new_entity_ids
 from grid_universe.systems.portal import portal_system
 
 
@@ -29,9 +32,9 @@ def make_entity_on_portal_state(
     portal2_pos: Tuple[int, int],
 ) -> State:
     position = {
-        entity_id: Position(*entity_pos),
-        portal1_id: Position(*portal1_pos),
-        portal2_id: Position(*portal2_pos),
+        entity_id: Position.from_tuple(entity_pos),
+        portal1_id: Position.from_tuple(portal1_pos),
+        portal2_id: Position.from_tuple(portal2_pos),
     }
     portal = {
         portal1_id: Portal(pair_entity=portal2_id),
@@ -49,7 +52,7 @@ def make_entity_on_portal_state(
     return State(
         width=10,
         height=10,
-        move_fn=lambda s, eid, d: [],
+        move_fn=noop_move_fn,
         objective_fn=default_objective_fn,
         position=pmap(position),
         agent=pmap(agent),
@@ -66,98 +69,115 @@ def make_entity_on_portal_state(
     )
 
 
-ENTITY_TYPES: List[Tuple[str, bool]] = [
-    ("agent", True),
-    ("pushable", False),
-]
+PortalSkeleton = Tuple[State, EntityID, EntityID, EntityID]
+
+
+@pytest.fixture(scope="module")
+def portal_skeleton() -> PortalSkeleton:
+    """Entity + portal pair shared by the parametrized portal tests."""
+    entity_id, portal1_id, portal2_id = new_entity_ids(3)
+    state: State = make_entity_on_portal_state(
+        entity_id, True, portal1_id, portal2_id, (0, 0), (0, 0), (0, 0)
+    )
+    return state, entity_id, portal1_id, portal2_id
+
+
+def place_on_portal_skeleton(
+    skeleton: PortalSkeleton,
+    is_agent: bool,
+    entity_pos: Tuple[int, int],
+    portal1_pos: Tuple[int, int],
+    portal2_pos: Tuple[int, int],
+) -> State:
+    """Reposition the skeleton's entities; unchanged stores are shared."""
+    state, entity_id, portal1_id, portal2_id = skeleton
+    position = (
+        state.position.set(entity_id, Position.from_tuple(entity_pos))
+        .set(portal1_id, Position.from_tuple(portal1_pos))
+        .set(portal2_id, Position.from_tuple(portal2_pos))
+    )
+    if is_agent:
+        agent = state.agent.set(entity_id, Agent())
+        pushable = state.pushable.discard(entity_id)
+    else:
+        agent = state.agent.discard(entity_id)
+        pushable = state.pushable.set(entity_id, Pushable())
+    return replace(
+        state,
+        position=position,
+        prev_position=position,  # assume standing still at the beginning
+        agent=agent,
+        pushable=pushable,
+        appearance=state.appearance.set(
+            entity_id, Appearance(name=("human" if is_agent else "box"))
+        ),
+    )
+
 
+ENTITY_IS_AGENT: List[bool] = [True, False]
+ENTITY_LABELS: List[str] = ["agent", "pushable"]
 
-@pytest.mark.parametrize("entity_label,is_agent", ENTITY_TYPES)
+
+@pytest.mark.parametrize("is_agent", ENTITY_IS_AGENT, ids=ENTITY_LABELS)
 def test_entity_standing_on_portal_does_not_teleport(
-    entity_label: str,
+    portal_skeleton: PortalSkeleton,
     is_agent: bool,
 ) -> None:
-    entity_id: EntityID = new_entity_id()
-    portal1_id: EntityID = new_entity_id()
-    portal2_id: EntityID = new_entity_id()
+    entity_id: EntityID = portal_skeleton[1]
     entity_pos: Tuple[int, int] = (4, 4)
     portal1_pos: Tuple[int, int] = (4, 4)
     portal2_pos: Tuple[int, int] = (7, 7)
 
-    state: State = make_entity_on_portal_state(
-        entity_id,
-        is_agent,
-        portal1_id,
-        portal2_id,
-        entity_pos,
-        portal1_pos,
-        portal2_pos,
+    state: State = place_on_portal_skeleton(
+        portal_skeleton, is_agent, entity_pos, portal1_pos, portal2_pos
     )
 
     new_state: State = portal_system(state)
-    assert new_state.position[entity_id] == Position(*portal1_pos)
+    assert new_state.position[entity_id] == Position.from_tuple(portal1_pos)
 
 
-@pytest.mark.parametrize("entity_label, is_agent", ENTITY_TYPES)
+@pytest.mark.parametrize("is_agent", ENTITY_IS_AGENT, ids=ENTITY_LABELS)
 def test_entity_teleported_when_entering_portal(
-    entity_label: str,
+    portal_skeleton: PortalSkeleton,
     is_agent: bool,
 ) -> None:
-    entity_id: EntityID = new_entity_id()
-    portal1_id: EntityID = new_entity_id()
-    portal2_id: EntityID = new_entity_id()
+    entity_id: EntityID = portal_skeleton[1]
     start_pos: Tuple[int, int] = (1, 1)
     portal1_pos: Tuple[int, int] = (4, 4)
     portal2_pos: Tuple[int, int] = (7, 7)
 
-    state: State = make_entity_on_portal_state(
-        entity_id,
-        is_agent,
-        portal1_id,
-        portal2_id,
-        start_pos,
-        portal1_pos,
-        portal2_pos,
+    state: State = place_on_portal_skeleton(
+        portal_skeleton, is_agent, start_pos, portal1_pos, portal2_pos
     )
     moved_state: State = replace(
         state,
-        position=state.position.set(entity_id, Position(*portal1_pos)),
+        position=state.position.set(entity_id, Position.from_tuple(portal1_pos)),
         prev_position=state.position,
     )
     new_state: State = portal_system(moved_state)
-    assert new_state.position[entity_id] == Position(*portal2_pos)
+    assert new_state.position[entity_id] == Position.from_tuple(portal2_pos)
 
 
-@pytest.mark.parametrize("entity_label, is_agent", ENTITY_TYPES)
+@pytest.mark.parametrize("is_agent", ENTITY_IS_AGENT, ids=ENTITY_LABELS)
 def test_entity_not_teleported_if_not_on_portal(
-    entity_label: str,
+    portal_skeleton: PortalSkeleton,
     is_agent: bool,
 ) -> None:
-    entity_id: EntityID = new_entity_id()
-    portal1_id: EntityID = new_entity_id()
-    portal2_id: EntityID = new_entity_id()
+    entity_id: EntityID = portal_skeleton[1]
     entity_pos: Tuple[int, int] = (1, 2)
     portal1_pos: Tuple[int, int] = (3, 5)
     portal2_pos: Tuple[int, int] = (7, 7)
 
-    state: State = make_entity_on_portal_state(
-        entity_id,
-        is_agent,
-        portal1_id,
-        portal2_id,
-        entity_pos,
-        portal1_pos,
-        portal2_pos,
+    state: State = place_on_portal_skeleton(
+        portal_skeleton, is_agent, entity_pos, portal1_pos, portal2_pos
     )
 
     new_state: State = portal_system(state)
-    assert new_state.position[entity_id] == Position(*entity_pos)
+    assert new_state.position[entity_id] == Position.from_tuple(entity_pos)
 
 
 def test_pushable_teleported_when_pushed_onto_portal() -> None:
-    entity_id: EntityID = new_entity_id()
-    portal1_id: EntityID = new_entity_id()
-    portal2_id: EntityID = new_entity_id()
+    entity_id, portal1_id, portal2_id = new_entity_ids(3)
     start_pos: Tuple[int, int] = (2, 2)
     portal1_pos: Tuple[int, int] = (4, 4)
     portal2_pos: Tuple[int, int] = (8, 8)
@@ -166,21 +186,20 @@ def test_pushable_teleported_when_pushed_onto_portal() -> None:
     )
     moved_state: State = replace(
         state,
-        position=state.position.set(entity_id, Position(*portal1_pos)),
+        position=state.position.set(entity_id, Position.from_tuple(portal1_pos)),
         prev_position=state.position,
     )
     new_state: State = portal_system(moved_state)
-    assert new_state.position[entity_id] == Position(*portal2_pos)
+    assert new_state.position[entity_id] == Position.from_tuple(portal2_pos)
 
 
 def test_portal_pair_missing_does_not_crash() -> None:
-    agent_id: EntityID = new_entity_id()
-    portal1_id: EntityID = new_entity_id()
+    agent_id, portal1_id = new_entity_ids(2)
     agent_pos: Tuple[int, int] = (2, 2)
     portal1_pos: Tuple[int, int] = (2, 2)
     position = {
-        agent_id: Position(*agent_pos),
-        portal1_id: Position(*portal1_pos),
+        agent_id: Position.from_tuple(agent_pos),
+        portal1_id: Position.from_tuple(portal1_pos),
     }
     portal = {portal1_id: Portal(pair_entity=999)}
     collidable = {agent_id: Collidable()}
@@ -191,7 +210,7 @@ def test_portal_pair_missing_does_not_crash() -> None:
     state: State = State(
         width=5,
         height=5,
-        move_fn=lambda s, eid, d: [],
+        move_fn=noop_move_fn,
         objective_fn=default_objective_fn,
         position=pmap(position),
         agent=pmap({agent_id: Agent()}),
@@ -201,30 +220,27 @@ def test_portal_pair_missing_does_not_crash() -> None:
         prev_position=pmap(position),
     )
     new_state: State = portal_system(state)
-    assert new_state.position[agent_id] == Position(*agent_pos)
+    assert new_state.position[agent_id] == Position.from_tuple(agent_pos)
 
 
 def test_multiple_entities_on_portal_all_blocked() -> None:
-    agent_id: EntityID = new_entity_id()
-    pushable_id: EntityID = new_entity_id()
-    portal1_id: EntityID = new_entity_id()
-    portal2_id: EntityID = new_entity_id()
+    agent_id, pushable_id, portal1_id, portal2_id = new_entity_ids(4)
     portal1_pos: Tuple[int, int] = (2, 2)
     portal2_pos: Tuple[int, int] = (7, 7)
     prev_agent_pos: Tuple[int, int] = (1, 2)
     prev_pushable_pos: Tuple[int, int] = (6, 7)
-    position = {
-        agent_id: Position(*portal1_pos),
-        pushable_id: Position(*portal2_pos),
-        portal1_id: Position(*portal1_pos),
-        portal2_id: Position(*portal2_pos),
-    }
-    prev_position = {
-        agent_id: Position(*prev_agent_pos),
-        pushable_id: Position(*prev_pushable_pos),
-        portal1_id: Position(*portal1_pos),
-        portal2_id: Position(*portal2_pos),
-    }
+    position = pmap(
+        {
+            agent_id: Position.from_tuple(portal1_pos),
+            pushable_id: Position.from_tuple(portal2_pos),
+            portal1_id: Position.from_tuple(portal1_pos),
+            portal2_id: Position.from_tuple(portal2_pos),
+        }
+    )
+    # Portal entries are shared with ``position``; only the movers differ.
+    prev_position = position.set(agent_id, Position.from_tuple(prev_agent_pos)).set(
+        pushable_id, Position.from_tuple(prev_pushable_pos)
+    )
     portal = {
         portal1_id: Portal(pair_entity=portal2_id),
         portal2_id: Portal(pair_entity=portal1_id),
@@ -239,10 +255,10 @@ def test_multiple_entities_on_portal_all_blocked() -> None:
     state = State(
         width=10,
         height=10,
-        move_fn=lambda s, eid, d: [],
+        move_fn=noop_move_fn,
         objective_fn=default_objective_fn,
-        position=pmap(position),
-        prev_position=pmap(prev_position),
+        position=position,
+        prev_position=prev_position,
         agent=pmap({agent_id: Agent()}),
         pushable=pmap({pushable_id: Pushable()}),
         portal=pmap(portal),
@@ -250,8 +266,8 @@ def test_multiple_entities_on_portal_all_blocked() -> None:
         collidable=pmap(collidable),
     )
     new_state: State = portal_system(state)
-    assert new_state.position[agent_id] == Position(*portal1_pos)
-    assert new_state.position[pushable_id] == Position(*portal2_pos)
+    assert new_state.position[agent_id] == Position.from_tuple(portal1_pos)
+    assert new_state.position[pushable_id] == Position.from_tuple(portal2_pos)
 
 
 def test_entity_chained_portals_no_infinite_teleport() -> None:
@@ -262,27 +278,22 @@ def test_entity_chained_portals_no_infinite_teleport() -> None:
         Agent,
     )
 
-    agent_id: EntityID = new_entity_id()
-    portal_a: EntityID = new_entity_id()
-    portal_b: EntityID = new_entity_id()
-    portal_c: EntityID = new_entity_id()
+    agent_id, portal_a, portal_b, portal_c = new_entity_ids(4)
     pos_a: Tuple[int, int] = (2, 2)
     pos_b: Tuple[int, int] = (4, 4)
     pos_c: Tuple[int, int] = (6, 6)
     prev_agent_pos: Tuple[int, int] = (1, 2)  # Simulate moving onto portal A
 
-    position = {
-        agent_id: Position(*pos_a),
-        portal_a: Position(*pos_a),
-        portal_b: Position(*pos_b),
-        portal_c: Position(*pos_c),
-    }
-    prev_position = {
-        agent_id: Position(*prev_agent_pos),
-        portal_a: Position(*pos_a),
-        portal_b: Position(*pos_b),
-        portal_c: Position(*pos_c),
-    }
+    position = pmap(
+        {
+            agent_id: Position.from_tuple(pos_a),
+            portal_a: Position.from_tuple(pos_a),
+            portal_b: Position.from_tuple(pos_b),
+            portal_c: Position.from_tuple(pos_c),
+        }
+    )
+    # Portal entries are shared with ``position``; only the agent differs.
+    prev_position = position.set(agent_id, Position.from_tuple(prev_agent_pos))
     portal = {
         portal_a: Portal(pair_entity=portal_b),
         portal_b: Portal(pair_entity=portal_c),
@@ -298,10 +309,10 @@ def test_entity_chained_portals_no_infinite_teleport() -> None:
     state: State = State(
         width=10,
         height=10,
-        move_fn=lambda s, eid, d: [],
+        move_fn=noop_move_fn,
         objective_fn=default_objective_fn,
-        position=pmap(position),
-        prev_position=pmap(prev_position),
+        position=position,
+        prev_position=prev_position,
         agent=pmap({agent_id: Agent()}),
         portal=pmap(portal),
         appearance=pmap(appearance),
@@ -309,4 +320,4 @@ def test_entity_chained_portals_no_infinite_teleport() -> None:
     )
     new_state: State = portal_system(state)
     # Only one teleport: A→B (not B→C or C→A)
-    assert new_state.position[agent_id] == Position(*pos_b)
+    assert new_state.position[agent_id] == Position.from_tuple(pos_b)
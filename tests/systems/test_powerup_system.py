@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import List, Dict, Tuple, Optional, TypedDict, Literal
-from pyrsistent import pmap, pset, PMap, PSet
+from pyrsistent import pmap, pset
 from grid_universe.objectives import default_objective_fn
 from grid_universe.state import State
 from grid_universe.components import (
@@ -19,6 +21,16 @@ from grid_universe.entity import new_entity_id
 from grid_universe.types import EntityID
 from grid_universe.systems.status import status_system
 from grid_universe.utils.status import use_status_effect
+from tests.test_utils import AGENT, EMPTY_INVENTORY, noop_move_fn
+
+# Every store defaults to an empty PMap; helpers derive their states from this
+# template via ``replace`` so untouched stores are shared, not rebuilt.
+EMPTY_STATE: State = State(
+    width=1,
+    height=1,
+    move_fn=noop_move_fn,
+    objective_fn=default_objective_fn,
+)
 
 
 class RequiredEffectSpec(TypedDict):
@@ -31,70 +43,87 @@ class EffectSpec(RequiredEffectSpec, total=False):
     multiplier: int
 
 
+# One agent to build: an explicit ID (or None for a fresh one) plus its effects.
+AgentSpec = Tuple[Optional[EntityID], List[EffectSpec]]
+
+
+def _speed_from_spec(eff: EffectSpec) -> Speed:
+    multiplier = eff.get("multiplier")
+    return Speed(multiplier=2 if multiplier is None else multiplier)
+
+
 def build_agent_with_effects(
     agent_id: Optional[EntityID] = None,
     effects: Optional[List[EffectSpec]] = None,
 ) -> Tuple[State, EntityID, List[EntityID]]:
+    state, ((agent_id, effect_ids),) = build_multi_agent_state(
+        [(agent_id, effects or [])]
+    )
+    return state, agent_id, effect_ids
+
+
+def build_multi_agent_state(
+    specs: List[AgentSpec],
+) -> Tuple[State, List[Tuple[EntityID, List[EntityID]]]]:
+    """Build every agent into one State, so tests never merge component maps."""
+    position: Dict[EntityID, Position] = {}
     agent: Dict[EntityID, Agent] = {}
     inventory: Dict[EntityID, Inventory] = {}
     appearance: Dict[EntityID, Appearance] = {}
+    status: Dict[EntityID, Status] = {}
     immunity: Dict[EntityID, Immunity] = {}
     speed: Dict[EntityID, Speed] = {}
     phasing: Dict[EntityID, Phasing] = {}
     time_limit: Dict[EntityID, TimeLimit] = {}
     usage_limit: Dict[EntityID, UsageLimit] = {}
-    effect_ids: List[EntityID] = []
-    status_effect_ids: PSet[EntityID] = pset()
-
-    if agent_id is None:
-        agent_id = new_entity_id()
-    agent[agent_id] = Agent()
-    inventory[agent_id] = Inventory(pset())
-    appearance[agent_id] = Appearance(name="human")
-    effects = effects or []
-
-    for eff in effects:
-        eid: EntityID = new_entity_id()
-        eff_type: Literal["immunity", "speed", "phasing"] = eff["type"]
-        if eff_type == "immunity":
-            immunity[eid] = Immunity()
-        elif eff_type == "speed":
-            multiplier: int = 2
-            if "multiplier" in eff and eff["multiplier"] is not None:
-                multiplier = eff["multiplier"]
-            speed[eid] = Speed(multiplier=multiplier)
-        elif eff_type == "phasing":
-            phasing[eid] = Phasing()
-        limit = eff.get("limit")
-        amount_raw = eff.get("amount")
-        if limit == "time" and amount_raw is not None:
-            time_limit[eid] = TimeLimit(amount=amount_raw)
-        if limit == "usage" and amount_raw is not None:
-            usage_limit[eid] = UsageLimit(amount=amount_raw)
-        effect_ids.append(eid)
-        status_effect_ids = status_effect_ids.add(eid)
-
-    status: PMap[EntityID, Status] = pmap(
-        {agent_id: Status(effect_ids=status_effect_ids)}
-    )
-
-    state: State = State(
+    agents: List[Tuple[EntityID, List[EntityID]]] = []
+
+    for agent_id, effects in specs:
+        if agent_id is None:
+            agent_id = new_entity_id()
+        position[agent_id] = Position(0, 0)
+        agent[agent_id] = AGENT
+        inventory[agent_id] = EMPTY_INVENTORY
+        appearance[agent_id] = Appearance(name="human")
+        effect_ids: List[EntityID] = []
+        for eff in effects:
+            eid: EntityID = new_entity_id()
+            if eff["type"] == "immunity":
+                immunity[eid] = Immunity()
+            elif eff["type"] == "speed":
+                speed[eid] = _speed_from_spec(eff)
+            elif eff["type"] == "phasing":
+                phasing[eid] = Phasing()
+            else:
+                raise ValueError(f"Unknown effect type: {eff['type']!r}")
+            limit = eff.get("limit")
+            amount_raw = eff.get("amount")
+            if limit == "time" and amount_raw is not None:
+                time_limit[eid] = TimeLimit(amount_raw)
+            elif limit == "usage" and amount_raw is not None:
+                usage_limit[eid] = UsageLimit(amount_raw)
+            elif limit not in (None, "time", "usage"):
+                raise ValueError(f"Unknown effect limit: {limit!r}")
+            effect_ids.append(eid)
+        # Build the effect set in one go rather than one .add() per effect.
+        status[agent_id] = Status(effect_ids=pset(effect_ids))
+        agents.append((agent_id, effect_ids))
+
+    state: State = replace(
+        EMPTY_STATE,
         width=3,
-        height=1,
-        move_fn=lambda s, eid, dir: [],
-        objective_fn=default_objective_fn,
-        position=pmap({agent_id: Position(0, 0)}),
+        position=pmap(position),
         agent=pmap(agent),
         inventory=pmap(inventory),
         appearance=pmap(appearance),
+        status=pmap(status),
         immunity=pmap(immunity),
         speed=pmap(speed),
         phasing=pmap(phasing),
         time_limit=pmap(time_limit),
         usage_limit=pmap(usage_limit),
-        status=status,
     )
-    return state, agent_id, effect_ids
+    return state, agents
 
 
 # --- TESTS ---
@@ -198,23 +227,11 @@ def test_multiple_effects_tick_independently() -> None:
 
 
 def test_multi_agent_effects_are_isolated() -> None:
-    state1, agent1, eff1 = build_agent_with_effects(
-        agent_id=1, effects=[EffectSpec(type="immunity", limit="time", amount=1)]
-    )
-    state2, agent2, eff2 = build_agent_with_effects(
-        agent_id=2, effects=[EffectSpec(type="speed", limit="usage", amount=2)]
-    )
-    state = replace(
-        state1,
-        position=state1.position.update(state2.position),
-        agent=state1.agent.update(state2.agent),
-        inventory=state1.inventory.update(state2.inventory),
-        appearance=state1.appearance.update(state2.appearance),
-        immunity=state1.immunity.update(state2.immunity),
-        speed=state1.speed.update(state2.speed),
-        status=state1.status.update(state2.status),
-        time_limit=state1.time_limit.update(state2.time_limit),
-        usage_limit=state1.usage_limit.update(state2.usage_limit),
+    state, [(agent1, _), (agent2, eff2)] = build_multi_agent_state(
+        [
+            (1, [EffectSpec(type="immunity", limit="time", amount=1)]),
+            (2, [EffectSpec(type="speed", limit="usage", amount=2)]),
+        ]
     )
     state2 = status_system(state)
     assert not state2.status[agent1].effect_ids
@@ -229,13 +246,7 @@ def test_status_effects_empty_is_robust() -> None:
 
 
 def test_status_system_no_agents() -> None:
-    state = State(
-        width=1,
-        height=1,
-        move_fn=lambda s, eid, dir: [],
-        objective_fn=default_objective_fn,
-    )
-    state2 = status_system(state)
+    state2 = status_system(EMPTY_STATE)
     assert state2.status == pmap()
 
 
@@ -273,13 +284,10 @@ def test_multiple_usage_limited_effects_are_used_one_at_a_time() -> None:
 def test_status_cleanup_for_missing_effect() -> None:
     agent_id: EntityID = new_entity_id()
     ghost_effect: EntityID = new_entity_id()
-    state = State(
-        width=1,
-        height=1,
-        move_fn=lambda s, eid, dir: [],
-        objective_fn=default_objective_fn,
+    state = replace(
+        EMPTY_STATE,
         position=pmap({agent_id: Position(0, 0)}),
-        agent=pmap({agent_id: Agent()}),
+        agent=pmap({agent_id: AGENT}),
         status=pmap({agent_id: Status(effect_ids=pset([ghost_effect]))}),
         appearance=pmap({agent_id: Appearance(name="human")}),
     )
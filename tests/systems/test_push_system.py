@@ -1,6 +1,9 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Dict, List, Tuple, Optional
-from pyrsistent import pmap, pset
+import pytest
+from pyrsistent import pmap
 from grid_universe.objectives import default_objective_fn
 from grid_universe.state import State
 from grid_universe.types import EntityID
@@ -12,13 +15,21 @@ from grid_universe.components import (
     Pushable,
     Blocking,
     Appearance,
-    Exit,
     Collectible,
     Portal,
 )
 from grid_universe.systems.push import push_system
 from grid_universe.entity import new_entity_id
 from grid_universe.actions import Action
+from tests.test_utils import (
+    AGENT,
+    BLOCKING,
+    COLLIDABLE,
+    EMPTY_INVENTORY,
+    EXIT,
+    PUSHABLE,
+    push_move_fn,
+)
 
 
 def make_push_state(
@@ -38,9 +49,9 @@ def make_push_state(
 
     agent_id: EntityID = new_entity_id()
     pos[agent_id] = Position(*agent_pos)
-    agent[agent_id] = Agent()
-    inventory[agent_id] = Inventory(pset())
-    collidable[agent_id] = Collidable()
+    agent[agent_id] = AGENT
+    inventory[agent_id] = EMPTY_INVENTORY
+    collidable[agent_id] = COLLIDABLE
     appearance[agent_id] = Appearance(name="human")
 
     box_ids: List[EntityID] = []
@@ -48,8 +59,8 @@ def make_push_state(
         for bpos in box_positions:
             bid: EntityID = new_entity_id()
             pos[bid] = Position(*bpos)
-            pushable[bid] = Pushable()
-            collidable[bid] = Collidable()
+            pushable[bid] = PUSHABLE
+            collidable[bid] = COLLIDABLE
             appearance[bid] = Appearance(name="box")
             box_ids.append(bid)
 
@@ -58,22 +69,15 @@ def make_push_state(
         for wpos in wall_positions:
             wid: EntityID = new_entity_id()
             pos[wid] = Position(*wpos)
-            blocking[wid] = Blocking()
-            collidable[wid] = Collidable()
+            blocking[wid] = BLOCKING
+            collidable[wid] = COLLIDABLE
             appearance[wid] = Appearance(name="wall")
             wall_ids.append(wid)
 
     state: State = State(
         width=width,
         height=height,
-        move_fn=lambda s, eid, dir: [
-            Position(
-                s.position[eid].x
-                + (1 if dir == Action.RIGHT else -1 if dir == Action.LEFT else 0),
-                s.position[eid].y
-                + (1 if dir == Action.DOWN else -1 if dir == Action.UP else 0),
-            )
-        ],
+        move_fn=push_move_fn,
         objective_fn=default_objective_fn,
         position=pmap(pos),
         agent=pmap(agent),
@@ -177,7 +181,7 @@ def test_push_box_onto_exit() -> None:
     exit_id: EntityID = new_entity_id()
     state = replace(
         state,
-        exit=state.exit.set(exit_id, Exit()),
+        exit=state.exit.set(exit_id, EXIT),
         position=state.position.set(exit_id, Position(2, 0)),
     )
     next_state = push_system(state, agent_id, Position(1, 0))
@@ -226,10 +230,10 @@ def test_push_box_onto_agent() -> None:
     other_agent_id: EntityID = new_entity_id()
     state = replace(
         state,
-        agent=state.agent.set(other_agent_id, Agent()),
-        collidable=state.collidable.set(other_agent_id, Collidable()),
+        agent=state.agent.set(other_agent_id, AGENT),
+        collidable=state.collidable.set(other_agent_id, COLLIDABLE),
         position=state.position.set(other_agent_id, Position(2, 0)),
-        inventory=state.inventory.set(other_agent_id, Inventory(pset())),
+        inventory=state.inventory.set(other_agent_id, EMPTY_INVENTORY),
     )
     next_state = push_system(state, agent_id, Position(1, 0))
     check_positions(
@@ -242,26 +246,33 @@ def test_push_box_onto_agent() -> None:
     )
 
 
-def test_push_box_left_right_up_down() -> None:
-    cases: List[Tuple[Action, Tuple[int, int], Tuple[int, int], Tuple[int, int]]] = [
+@pytest.mark.parametrize(
+    "direction, agent_p, box_p, dest_p",
+    [
         (Action.RIGHT, (0, 0), (1, 0), (2, 0)),
         (Action.LEFT, (2, 0), (1, 0), (0, 0)),
         (Action.DOWN, (0, 0), (0, 1), (0, 2)),
         (Action.UP, (0, 2), (0, 1), (0, 0)),
-    ]
-    for direction, agent_p, box_p, dest_p in cases:
-        state, agent_id, box_ids, _ = make_push_state(
-            agent_pos=agent_p, box_positions=[box_p], width=3, height=3
-        )
-        next_box_pos = Position(*dest_p)
-        next_state = push_system(state, agent_id, Position(*box_p))
-        check_positions(
-            next_state,
-            {
-                agent_id: Position(*box_p),
-                box_ids[0]: next_box_pos,
-            },
-        )
+    ],
+    ids=["right", "left", "down", "up"],
+)
+def test_push_box_left_right_up_down(
+    direction: Action,
+    agent_p: Tuple[int, int],
+    box_p: Tuple[int, int],
+    dest_p: Tuple[int, int],
+) -> None:
+    state, agent_id, box_ids, _ = make_push_state(
+        agent_pos=agent_p, box_positions=[box_p], width=3, height=3
+    )
+    next_state = push_system(state, agent_id, Position(*box_p))
+    check_positions(
+        next_state,
+        {
+            agent_id: Position(*box_p),
+            box_ids[0]: Position(*dest_p),
+        },
+    )
 
 
 def test_push_box_on_narrow_grid_edge() -> None:
@@ -335,7 +346,7 @@ def test_push_box_onto_multiple_collidables() -> None:
     state = replace(
         state,
         collectible=state.collectible.set(collectible_id, Collectible()),
-        exit=state.exit.set(exit_id, Exit()),
+        exit=state.exit.set(exit_id, EXIT),
         position=state.position.set(collectible_id, Position(2, 0)).set(
             exit_id, Position(2, 0)
         ),
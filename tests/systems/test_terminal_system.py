@@ -1,19 +1,21 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Dict, List, Tuple
-from pyrsistent import pmap, pset, PMap
+from pyrsistent import pmap, PMap
 from grid_universe.objectives import default_objective_fn
 from grid_universe.systems.terminal import win_system, lose_system
 from grid_universe.components import (
     Agent,
     Requirable,
     Collectible,
-    Exit,
     Inventory,
     Dead,
     Position,
     Appearance,
 )
 from grid_universe.state import State
+from tests.test_utils import AGENT, EMPTY_INVENTORY, EXIT
 from grid_universe.types import EntityID
 
 
@@ -24,9 +26,9 @@ def make_terminal_state(
     exit_id: EntityID = 2
     requirable_ids: List[EntityID] = [3, 4]
 
-    agent: Dict[EntityID, Agent] = {agent_id: Agent()}
+    agent: Dict[EntityID, Agent] = {agent_id: AGENT}
     pos: Dict[EntityID, Position] = {}
-    inventory: Dict[EntityID, Inventory] = {agent_id: Inventory(pset())}
+    inventory: Dict[EntityID, Inventory] = {agent_id: EMPTY_INVENTORY}
     requirable: Dict[EntityID, Requirable] = {}
     collectible: Dict[EntityID, Collectible] = {}
     appearance: Dict[EntityID, Appearance] = {
@@ -49,7 +51,7 @@ def make_terminal_state(
         else:
             # Collected: add to inventory, not to collectible
             inventory[agent_id] = Inventory(
-                item_ids=pset(list(inventory[agent_id].item_ids) + [rid])
+                item_ids=inventory[agent_id].item_ids.add(rid)
             )
 
     state: State = State(
@@ -59,7 +61,7 @@ def make_terminal_state(
         objective_fn=default_objective_fn,
         position=pmap(pos),
         agent=pmap(agent),
-        exit=pmap({exit_id: Exit()}),
+        exit=pmap({exit_id: EXIT}),
         collectible=pmap(collectible),
         requirable=pmap(requirable),
         inventory=pmap(inventory),
@@ -179,7 +181,7 @@ def test_win_when_on_any_exit() -> None:
     # Add another exit at agent's position
     exit2_id = 77
     pos = state.position.set(exit2_id, state.position[agent_id])
-    exits = state.exit.set(exit2_id, Exit())
+    exits = state.exit.set(exit2_id, EXIT)
     state = replace(state, exit=exits, position=pos)
     new_state = win_system(state, agent_id)
     assert new_state.win
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 from dataclasses import replace
 from typing import Dict, List, Optional, Tuple
-from pyrsistent import pmap, pset, PMap
+from pyrsistent import pmap, PMap
 from grid_universe.objectives import default_objective_fn
 from grid_universe.state import State
 from grid_universe.components import (
@@ -15,6 +17,13 @@ from grid_universe.components import (
 )
 from grid_universe.systems.tile import tile_reward_system, tile_cost_system
 from grid_universe.types import EntityID
+from tests.test_utils import (
+    AGENT,
+    COLLECTIBLE,
+    DEAD,
+    EMPTY_INVENTORY,
+    EMPTY_PMAP,
+)
 
 
 def make_tile_state(
@@ -29,13 +38,13 @@ def make_tile_state(
 ) -> Tuple[State, EntityID]:
     agent_id: EntityID = 1
     pos: Dict[EntityID, Position] = {agent_id: Position(*agent_pos)}
-    agent_map: Dict[EntityID, Agent] = {agent_id: Agent()} if agent_in_state else {}
+    agent_map: Dict[EntityID, Agent] = {agent_id: AGENT} if agent_in_state else {}
     reward_map: Dict[EntityID, Rewardable] = {}
     cost_map: Dict[EntityID, Cost] = {}
     collectible_map: Dict[EntityID, Collectible] = {}
-    inventory: Dict[EntityID, Inventory] = {agent_id: Inventory(pset())}
+    inventory: Dict[EntityID, Inventory] = {agent_id: EMPTY_INVENTORY}
     appearance: Dict[EntityID, Appearance] = {agent_id: Appearance(name="human")}
-    dead: PMap[EntityID, Dead] = pmap({agent_id: Dead()}) if agent_dead else pmap()
+    dead: PMap[EntityID, Dead] = pmap({agent_id: DEAD}) if agent_dead else EMPTY_PMAP
 
     rewardable_ids = rewardable_ids or []
     cost_ids = cost_ids or []
@@ -51,7 +60,7 @@ def make_tile_state(
         appearance[cid] = Appearance(name="coin")
     for colid in collectible_ids:
         pos[colid] = Position(*agent_pos)
-        collectible_map[colid] = Collectible()
+        collectible_map[colid] = COLLECTIBLE
         appearance[colid] = Appearance(name="core")
 
     state: State = State(
@@ -184,10 +193,10 @@ def test_multiple_agents_separate_scores() -> None:
         3: Position(0, 0),  # rewardable for agent1
         4: Position(1, 0),  # cost for agent2
     }
-    agent_map: Dict[EntityID, Agent] = {agent1_id: Agent(), agent2_id: Agent()}
+    agent_map: Dict[EntityID, Agent] = {agent1_id: AGENT, agent2_id: AGENT}
     rewardable = {3: Rewardable(amount=12)}
     cost = {4: Cost(amount=7)}
-    inventory = {agent1_id: Inventory(pset()), agent2_id: Inventory(pset())}
+    inventory = {agent1_id: EMPTY_INVENTORY, agent2_id: EMPTY_INVENTORY}
     appearance: Dict[EntityID, Appearance] = {
         agent1_id: Appearance(name="human"),
         agent2_id: Appearance(name="human"),
@@ -1,6 +1,9 @@
-from typing import Dict, Tuple, List, Optional, Type, TypeVar, TypedDict
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple, List, Optional, Sequence, Type, TypeVar, TypedDict
 from pyrsistent import pmap, pset
-from pyrsistent.typing import PMap
+from pyrsistent.typing import PMap, PSet
+from grid_universe.actions import Action
 from grid_universe.objectives import default_objective_fn
 from grid_universe.state import State
 from grid_universe.components import (
@@ -31,9 +34,39 @@ from grid_universe.components import (
     UsageLimit,
     Status,
 )
-from grid_universe.entity import new_entity_id
+from grid_universe.entity import new_entity_id, new_entity_ids
 from grid_universe.types import EntityID, MoveFn, ObjectiveFn
-from grid_universe.moves import default_move_fn
+from grid_universe.moves import MOVEMENT_MAP, default_move_fn
+
+
+# Stateless tag components are immutable, so one shared instance per type can
+# be reused instead of allocating an equal copy for every entity.
+AGENT = Agent()
+BLOCKING = Blocking()
+COLLECTIBLE = Collectible()
+COLLIDABLE = Collidable()
+DEAD = Dead()
+EXIT = Exit()
+PUSHABLE = Pushable()
+
+# Shared empty persistent containers for builders that need an empty store.
+EMPTY_PMAP: PMap[Any, Any] = pmap()
+EMPTY_PSET: PSet[Any] = pset()
+EMPTY_INVENTORY = Inventory(item_ids=EMPTY_PSET)
+
+
+def noop_move_fn(
+    state: State, entity_id: EntityID, action: Action
+) -> Sequence[Position]:
+    """Move function that never proposes a step (for system-level tests)."""
+    return []
+
+
+def push_move_fn(state: State, eid: EntityID, action: Action) -> Sequence[Position]:
+    """One cardinal step via the shared delta table; other actions stay put."""
+    pos = state.position[eid]
+    dx, dy = MOVEMENT_MAP.get(action, (0, 0))
+    return [Position(pos.x + dx, pos.y + dy)]
 
 
 class MinimalEntities(TypedDict):
@@ -65,14 +98,14 @@ def make_minimal_key_door_state() -> Tuple[State, MinimalEntities]:
     pos[agent_id] = Position(*positions["agent"])
     pos[key_id] = Position(*positions["key"])
     pos[door_id] = Position(*positions["door"])
-    agent[agent_id] = Agent()
-    inventory[agent_id] = Inventory(pset())
+    agent[agent_id] = AGENT
+    inventory[agent_id] = EMPTY_INVENTORY
     key[key_id] = Key(key_id="red")
-    collectible[key_id] = Collectible()
+    collectible[key_id] = COLLECTIBLE
     locked[door_id] = Locked(key_id="red")
-    blocking[door_id] = Blocking()
-    collidable[agent_id] = Collidable()
-    collidable[door_id] = Collidable()
+    blocking[door_id] = BLOCKING
+    collidable[agent_id] = COLLIDABLE
+    collidable[door_id] = COLLIDABLE
     appearance[agent_id] = Appearance(name="human")
     appearance[key_id] = Appearance(name="key")
     appearance[door_id] = Appearance(name="door")
@@ -102,7 +135,7 @@ def make_exit_entity(
     exit_id = new_entity_id()
     return (
         exit_id,
-        {exit_id: Exit()},
+        {exit_id: EXIT},
         {exit_id: Position(*position)},
     )
 
@@ -128,30 +161,27 @@ def make_agent_box_wall_state(
 
     agent_id = new_entity_id()
     pos[agent_id] = Position(*agent_pos)
-    agent[agent_id] = Agent()
-    inventory[agent_id] = Inventory(pset())
-    collidable[agent_id] = Collidable()
+    agent[agent_id] = AGENT
+    inventory[agent_id] = EMPTY_INVENTORY
+    collidable[agent_id] = COLLIDABLE
     appearance[agent_id] = Appearance(name="human")
 
-    box_ids: List[EntityID] = []
-    if box_positions:
-        for bpos in box_positions:
-            bid = new_entity_id()
-            pos[bid] = Position(*bpos)
-            pushable[bid] = Pushable()
-            collidable[bid] = Collidable()
-            appearance[bid] = Appearance(name="box")
-            box_ids.append(bid)
-
-    wall_ids: List[EntityID] = []
-    if wall_positions:
-        for wpos in wall_positions:
-            wid = new_entity_id()
-            pos[wid] = Position(*wpos)
-            blocking[wid] = Blocking()
-            collidable[wid] = Collidable()
-            appearance[wid] = Appearance(name="wall")
-            wall_ids.append(wid)
+    box_positions = box_positions or []
+    wall_positions = wall_positions or []
+    box_ids: List[EntityID] = new_entity_ids(len(box_positions))
+    wall_ids: List[EntityID] = new_entity_ids(len(wall_positions))
+
+    # Components are frozen, so each kind is shared across its entities and
+    # every store is filled with one bulk update.
+    pos.update(zip(box_ids, map(Position.from_tuple, box_positions)))
+    pushable.update(dict.fromkeys(box_ids, PUSHABLE))
+    collidable.update(dict.fromkeys(box_ids, COLLIDABLE))
+    appearance.update(dict.fromkeys(box_ids, Appearance(name="box")))
+
+    pos.update(zip(wall_ids, map(Position.from_tuple, wall_positions)))
+    blocking.update(dict.fromkeys(wall_ids, BLOCKING))
+    collidable.update(dict.fromkeys(wall_ids, COLLIDABLE))
+    appearance.update(dict.fromkeys(wall_ids, Appearance(name="wall")))
 
     state = State(
         width=width,
@@ -188,12 +218,20 @@ def filter_component_map(
     key: str,
     typ: Type[T],
 ) -> Dict[EntityID, T]:
-    result: Dict[EntityID, T] = {}
-    if extra_components and key in extra_components:
-        for k, v in extra_components[key].items():
-            if isinstance(v, typ):
-                result[k] = v
-    return result
+    if not extra_components or key not in extra_components:
+        return {}
+    return {k: v for k, v in extra_components[key].items() if isinstance(v, typ)}
+
+
+def _extra_store(
+    extra_components: Optional[Dict[str, Dict[EntityID, object]]],
+    key: str,
+    typ: Type[T],
+) -> PMap[EntityID, T]:
+    """Typed store for ``make_agent_state``; unsupplied stores share the empty PMap."""
+    if not extra_components or key not in extra_components:
+        return EMPTY_PMAP
+    return pmap(filter_component_map(extra_components, key, typ))
 
 
 def make_agent_state(
@@ -210,9 +248,11 @@ def make_agent_state(
     positions: Dict[EntityID, Position] = {agent_id: Position(*agent_pos)}
     positions.update(filter_component_map(extra_components, "position", Position))
 
-    agent_map: Dict[EntityID, Agent] = {agent_id: Agent()}
-    inventory: Dict[EntityID, Inventory] = {agent_id: Inventory(pset())}
-    dead_map: PMap[EntityID, Dead] = pmap({agent_id: Dead()}) if agent_dead else pmap()
+    agent_map: Dict[EntityID, Agent] = {agent_id: AGENT}
+    inventory: Dict[EntityID, Inventory] = {agent_id: EMPTY_INVENTORY}
+    dead_map: PMap[EntityID, Dead] = (
+        pmap({agent_id: DEAD}) if agent_dead else EMPTY_PMAP
+    )
 
     state: State = State(
         width=width,
@@ -223,45 +263,29 @@ def make_agent_state(
         ),
         position=pmap(positions),
         agent=pmap(agent_map),
-        pushable=pmap(filter_component_map(extra_components, "pushable", Pushable)),
-        locked=pmap(filter_component_map(extra_components, "locked", Locked)),
-        portal=pmap(filter_component_map(extra_components, "portal", Portal)),
-        exit=pmap(filter_component_map(extra_components, "exit", Exit)),
-        key=pmap(filter_component_map(extra_components, "key", Key)),
-        collectible=pmap(
-            filter_component_map(extra_components, "collectible", Collectible)
-        ),
-        rewardable=pmap(
-            filter_component_map(extra_components, "rewardable", Rewardable)
-        ),
-        cost=pmap(filter_component_map(extra_components, "cost", Cost)),
-        requirable=pmap(
-            filter_component_map(extra_components, "requirable", Requirable)
-        ),
         inventory=pmap(inventory),
-        health=pmap(filter_component_map(extra_components, "health", Health)),
-        appearance=pmap(
-            filter_component_map(extra_components, "appearance", Appearance)
-        ),
-        blocking=pmap(filter_component_map(extra_components, "blocking", Blocking)),
         dead=dead_map,
-        moving=pmap(filter_component_map(extra_components, "moving", Moving)),
-        collidable=pmap(
-            filter_component_map(extra_components, "collidable", Collidable)
-        ),
-        damage=pmap(filter_component_map(extra_components, "damage", Damage)),
-        lethal_damage=pmap(
-            filter_component_map(extra_components, "lethal_damage", LethalDamage)
-        ),
-        immunity=pmap(filter_component_map(extra_components, "immunity", Immunity)),
-        phasing=pmap(filter_component_map(extra_components, "phasing", Phasing)),
-        speed=pmap(filter_component_map(extra_components, "speed", Speed)),
-        time_limit=pmap(
-            filter_component_map(extra_components, "time_limit", TimeLimit)
-        ),
-        usage_limit=pmap(
-            filter_component_map(extra_components, "usage_limit", UsageLimit)
-        ),
-        status=pmap(filter_component_map(extra_components, "status", Status)),
+        pushable=_extra_store(extra_components, "pushable", Pushable),
+        locked=_extra_store(extra_components, "locked", Locked),
+        portal=_extra_store(extra_components, "portal", Portal),
+        exit=_extra_store(extra_components, "exit", Exit),
+        key=_extra_store(extra_components, "key", Key),
+        collectible=_extra_store(extra_components, "collectible", Collectible),
+        rewardable=_extra_store(extra_components, "rewardable", Rewardable),
+        cost=_extra_store(extra_components, "cost", Cost),
+        requirable=_extra_store(extra_components, "requirable", Requirable),
+        health=_extra_store(extra_components, "health", Health),
+        appearance=_extra_store(extra_components, "appearance", Appearance),
+        blocking=_extra_store(extra_components, "blocking", Blocking),
+        moving=_extra_store(extra_components, "moving", Moving),
+        collidable=_extra_store(extra_components, "collidable", Collidable),
+        damage=_extra_store(extra_components, "damage", Damage),
+        lethal_damage=_extra_store(extra_components, "lethal_damage", LethalDamage),
+        immunity=_extra_store(extra_components, "immunity", Immunity),
+        phasing=_extra_store(extra_components, "phasing", Phasing),
+        speed=_extra_store(extra_components, "speed", Speed),
+        time_limit=_extra_store(extra_components, "time_limit", TimeLimit),
+        usage_limit=_extra_store(extra_components, "usage_limit", UsageLimit),
+        status=_extra_store(extra_components, "status", Status),
     )
     return state, agent_id
@@ -0,0 +1,16 @@
+# tests/unit/test_entity.py
+
+from grid_universe.entity import EntityAllocator
+
+
+def test_allocator_hands_out_dense_ids() -> None:
+    allocator = EntityAllocator()
+    assert [allocator.new() for _ in range(4)] == [0, 1, 2, 3]
+
+
+def test_allocator_recycles_released_ids_first() -> None:
+    allocator = EntityAllocator()
+    first, second = allocator.new(), allocator.new()
+    allocator.release(first)
+    assert allocator.new() == first
+    assert allocator.new() == second + 1
@@ -1,5 +1,7 @@
 # tests/unit/test_moves.py
 
+from __future__ import annotations
+
 import pytest
 from typing import List, Sequence, Tuple, Dict
 from dataclasses import replace
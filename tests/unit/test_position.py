@@ -0,0 +1,54 @@
+# tests/unit/test_position.py
+
+import pytest
+
+from grid_universe.components import Position
+
+
+COORDS = [
+    (0, 0),
+    (3, 7),
+    (-1, 0),
+    (0, -1),
+    (-5, -9),
+    (65535, 65535),
+    (1 << 20, 1 << 20),
+    (-(1 << 40), (1 << 40) + 3),
+]
+
+
+@pytest.mark.parametrize("xy", COORDS)
+def test_from_tuple_matches_constructor(xy: tuple[int, int]) -> None:
+    pos = Position.from_tuple(xy)
+    assert pos == Position(*xy)
+    assert hash(pos) == hash(Position(*xy))
+    assert (pos.x, pos.y) == xy
+
+
+@pytest.mark.parametrize("xy", COORDS)
+def test_hash_equals_packed(xy: tuple[int, int]) -> None:
+    pos = Position(*xy)
+    assert hash(pos) == hash(pos.packed)
+    assert pos.packed == (xy[0] << 16) | (xy[1] & 0xFFFF)
+
+
+def test_packed_is_unique_within_16_bit_y() -> None:
+    seen = {Position(x, y).packed for x in range(-3, 4) for y in (0, 1, 0xFFFF)}
+    assert len(seen) == 7 * 3
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        (Position(0, 0), Position(0, 1 << 16)),
+        (Position(2, -1), Position(2, 0xFFFF)),
+        (Position(-4, 5), Position(-4, 5 - (1 << 30))),
+    ],
+)
+def test_colliding_hashes_stay_distinct_keys(a: Position, b: Position) -> None:
+    assert hash(a) == hash(b)
+    assert a != b
+    assert len({a, b}) == 2
+    lookup = {a: "a", b: "b"}
+    assert lookup[Position(a.x, a.y)] == "a"
+    assert lookup[Position.from_tuple((b.x, b.y))] == "b"
@@ -0,0 +1,60 @@
+# tests/unit/test_sklearn_snippets.py
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+import numpy as np
+import pytest
+
+linear_model = pytest.importorskip("sklearn.linear_model")
+pytest.importorskip("matplotlib")  # utils.py imports it at module level
+
+import utils
+
+
+def load_snippet(snippet: str) -> Any:
+    namespace: Dict[str, Any] = {}
+    exec(snippet, namespace)
+    return namespace["get_model"]()
+
+
+@pytest.mark.parametrize(
+    "n_classes, labels",
+    [
+        (2, np.array([3, 7])),
+        (3, np.array([0, 1, 2])),
+        (3, np.array(["bird", "cat", "dog"])),
+    ],
+)
+def test_compact_logistic_loader_matches_original(
+    n_classes: int, labels: np.ndarray
+) -> None:
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(90, 4))
+    y = labels[np.arange(90) % n_classes]
+    X += (np.arange(90) % n_classes)[:, None]
+    model = linear_model.LogisticRegression(max_iter=500).fit(X, y)
+
+    snippet = utils.generate_sklearn_loader_snippet(
+        model, compression="zlib", compact_logistic=True
+    )
+    assert "pickle" not in snippet
+    rebuilt = load_snippet(snippet)
+
+    np.testing.assert_array_equal(rebuilt.classes_, model.classes_)
+    assert rebuilt.classes_.dtype == model.classes_.dtype
+    np.testing.assert_array_equal(rebuilt.predict(X), model.predict(X))
+    np.testing.assert_array_equal(rebuilt.predict_proba(X), model.predict_proba(X))
+    np.testing.assert_array_equal(
+        rebuilt.decision_function(X), model.decision_function(X)
+    )
+
+
+def test_logistic_regression_uses_pickle_by_default() -> None:
+    X = np.array([[0.0], [1.0], [2.0], [3.0]])
+    model = linear_model.LogisticRegression().fit(X, [0, 0, 1, 1])
+
+    snippet = utils.generate_sklearn_loader_snippet(model, compression="none")
+    assert "pickle" in snippet
+    np.testing.assert_array_equal(load_snippet(snippet).predict(X), model.predict(X))
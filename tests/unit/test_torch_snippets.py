@@ -0,0 +1,144 @@
+# tests/unit/test_torch_snippets.py
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("matplotlib")  # utils.py imports it at module level
+
+import utils
+
+
+class TinyNet(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.fc = torch.nn.Linear(3, 2)
+        self.scale = 2.0
+
+    def forward(self, x):  # type: ignore[no-untyped-def]
+        return self.fc(x) * self.scale
+
+
+@pytest.fixture(autouse=True)
+def clear_script_cache() -> Iterator[None]:
+    utils._SCRIPT_CACHE.clear()
+    yield
+    utils._SCRIPT_CACHE.clear()
+
+
+def load_snippet(snippet: str, **names: Any) -> Any:
+    namespace: Dict[str, Any] = dict(names)
+    exec(snippet, namespace)
+    return namespace["get_model"]()
+
+
+def test_script_cache_reused_across_compression_variants() -> None:
+    model = TinyNet()
+    utils.generate_torch_loader_snippet(model, compression="none")
+    fingerprint, compiled = utils._SCRIPT_CACHE[model]
+    utils.generate_torch_loader_snippet(model, compression="zlib", level=1)
+    cached_fingerprint, cached = utils._SCRIPT_CACHE[model]
+    assert cached_fingerprint == fingerprint
+    assert cached is compiled
+
+
+def test_in_place_weight_change_recompiles() -> None:
+    model = TinyNet()
+    x = torch.ones(1, 3)
+    utils.generate_torch_loader_snippet(model)
+    fingerprint, compiled = utils._SCRIPT_CACHE[model]
+
+    with torch.no_grad():
+        model.fc.weight.add_(1.0)
+    snippet = utils.generate_torch_loader_snippet(model)
+
+    new_fingerprint, new_compiled = utils._SCRIPT_CACHE[model]
+    assert new_fingerprint != fingerprint
+    assert new_compiled is not compiled
+    torch.testing.assert_close(load_snippet(snippet)(x), model(x))
+
+
+def test_plain_attribute_change_recompiles() -> None:
+    model = TinyNet()
+    x = torch.ones(1, 3)
+    utils.generate_torch_loader_snippet(model)
+    fingerprint, compiled = utils._SCRIPT_CACHE[model]
+
+    model.scale = 3.0
+    snippet = utils.generate_torch_loader_snippet(model)
+
+    new_fingerprint, new_compiled = utils._SCRIPT_CACHE[model]
+    assert new_fingerprint != fingerprint
+    assert new_compiled is not compiled
+    torch.testing.assert_close(load_snippet(snippet)(x), model(x))
+
+
+def test_opaque_attribute_disables_caching() -> None:
+    model = TinyNet()
+    model.helper = object()
+    assert utils._model_fingerprint(model, "auto", None) is None
+
+
+def render_mmap_loader(b64: str, decomp_code: str, comp_name: str) -> str:
+    # Threshold 0 forces the temp-file/mmap path for tiny test payloads
+    return utils._render_full_pickle_loader(
+        b64, decomp_code, comp_name, __name__, "TinyNet", mmap_threshold=0
+    )
+
+
+def test_full_pickle_mmap_path_loads_and_removes_temp_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    model = TinyNet()
+    x = torch.ones(1, 3)
+    snippet = render_mmap_loader(*utils._save_to_b64(model, "zlib", 1))
+
+    torch.testing.assert_close(load_snippet(snippet)(x), model(x))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_full_pickle_mmap_path_removes_temp_file_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    b64, decomp_code, comp_name = utils._compress_to_b64(b"not a pickle", "none", 0)
+    snippet = render_mmap_loader(b64, decomp_code, comp_name)
+
+    with pytest.raises(Exception):
+        load_snippet(snippet)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_int8_keeps_non_finite_tensors_unquantized() -> None:
+    t = torch.tensor([1.0, float("inf"), -2.0, float("nan")])
+    kept = utils._quantize_tensor(t, "int8")
+    assert kept is t
+
+    q, scale = utils._quantize_tensor(torch.tensor([1.0, -2.0]), "int8")
+    assert q.dtype == torch.int8
+    assert torch.isfinite(scale)
+
+
+class MaskedNet(TinyNet):
+    def __init__(self) -> None:
+        super().__init__()
+        self.register_buffer("mask", torch.tensor([0.0, float("-inf"), float("nan")]))
+
+
+def test_int8_state_dict_loader_restores_non_finite_buffer() -> None:
+    model = MaskedNet()
+    b64, decomp_code, comp_name = utils._dump_state_dict_b64(model, "int8", "none", 0)
+    snippet = utils._render_state_dict_loader(
+        b64, decomp_code, comp_name, __name__, "MaskedNet", True, quantize="int8"
+    )
+
+    # The state_dict loader calls the class by name, as when pasted beside it
+    loaded = load_snippet(snippet, MaskedNet=MaskedNet)
+    torch.testing.assert_close(loaded.mask, model.mask, equal_nan=True)
+    torch.testing.assert_close(loaded.fc.weight, model.fc.weight, atol=1e-2, rtol=0.0)
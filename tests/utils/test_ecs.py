@@ -0,0 +1,43 @@
+# tests/utils/test_ecs.py
+
+from pyrsistent import pmap
+
+from grid_universe.components import Blocking, Position
+from grid_universe.types import EntityID
+from grid_universe.utils.ecs import occupied_positions
+
+
+def test_occupied_positions_projects_component_store() -> None:
+    a: EntityID = 1
+    b: EntityID = 2
+    position = pmap({a: Position(0, 0), b: Position(1, 0)})
+    blocking = pmap({a: Blocking(), 3: Blocking()})  # 3 has no position
+    assert occupied_positions(position, blocking) == frozenset({Position(0, 0)})
+
+
+def test_occupied_positions_follows_position_store_updates() -> None:
+    a: EntityID = 1
+    position = pmap({a: Position(0, 0)})
+    blocking = pmap({a: Blocking()})
+    before = occupied_positions(position, blocking)
+    # Same inputs hit the cache
+    assert occupied_positions(position, blocking) is before
+
+    moved = position.set(a, Position(2, 3))
+    assert occupied_positions(moved, blocking) == frozenset({Position(2, 3)})
+    assert occupied_positions(position, blocking) == frozenset({Position(0, 0)})
+
+
+def test_occupied_positions_follows_component_store_updates() -> None:
+    a: EntityID = 1
+    b: EntityID = 2
+    position = pmap({a: Position(0, 0), b: Position(1, 1)})
+    blocking = pmap({a: Blocking()})
+    assert occupied_positions(position, blocking) == frozenset({Position(0, 0)})
+
+    added = blocking.set(b, Blocking())
+    assert occupied_positions(position, added) == frozenset(
+        {Position(0, 0), Position(1, 1)}
+    )
+    removed = added.remove(a)
+    assert occupied_positions(position, removed) == frozenset({Position(1, 1)})
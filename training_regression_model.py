@@ -1,12 +1,16 @@
-import pandas as pd
+import functools
 import numpy as np
 from sklearn.linear_model import LogisticRegression
 from utils import generate_sklearn_loader_snippet
 
+@functools.lru_cache(maxsize=1)
 def get_model():
     """
     Reconstruct and return a scikit-learn model from an embedded, base64-encoded compressed blob.
 
+    The blob is decoded once and the same model object is returned on later
+    calls; callers only predict/score with it, so it is never mutated.
+
     Security note:
       This uses pickle-compatible loading. Only use if you trust the source.
     """
@@ -20,6 +24,8 @@ def get_model():
 
 
 def training_model():
+    import pandas as pd  # only needed to read the csv; keeps module import cheap
+
     CIPHERTEXT_PATH = "data/cipher_objective.csv"
     CIPHER_TEXT_PAIRS =  pd.read_csv(CIPHERTEXT_PATH).values.tolist()
 
@@ -27,9 +33,6 @@ def training_model():
     n = len(CIPHER_TEXT_PAIRS)
     d = len(CIPHER_TEXT_PAIRS[0][0])
 
-    X = np.zeros((n, d))
-    y = np.zeros(n)
-
     print("n:",n)
     print("d",d)
 
@@ -37,13 +40,18 @@ def training_model():
 
 
     print(len(CIPHER_TEXT_PAIRS[0][0]))
-    for training_data_number, cipher_text_pair in enumerate(CIPHER_TEXT_PAIRS):
-        cipher_text = cipher_text_pair[0]
-        for letter_num, c in enumerate(cipher_text):
-            # print(c)
-            # print(i)
-            X[training_data_number,letter_num] = ord(c)
-        y[training_data_number] = class_to_int[cipher_text_pair[1]]
+    # utf-32-le stores every code point as one 4-byte int equal to ord(c), so the
+    # whole feature matrix is a single buffer reshape instead of an n*d python loop
+    texts = [cipher_text_pair[0] for cipher_text_pair in CIPHER_TEXT_PAIRS]
+    if any(len(text) != d for text in texts):
+        raise ValueError("all cipher texts must have the same length")
+    buf = "".join(texts).encode("utf-32-le", errors="surrogatepass")
+    X = np.frombuffer(buf, dtype="<u4").reshape(n, d).astype(np.float64)
+    y = np.fromiter(
+        (class_to_int[cipher_text_pair[1]] for cipher_text_pair in CIPHER_TEXT_PAIRS),
+        dtype=np.float64,
+        count=n,
+    )
 
     train_num = 2000
     test_num = n/2-train_num
@@ -63,31 +71,30 @@ def training_model():
     print("inaccuracy on training data:", 1-model.score(X,y))
 
     if train_num != n/2:
-        X_test_0 = X[:2000-train_num, :]
-        X_test_1 = X[2000+train_num:, :]
-        y_pred_0 = model.predict(X_test_0)
-        y_pred_1 = model.predict(X_test_1)
+        # both held-out slices go through one predict call, then get split back
+        split = 2000-train_num
+        X_test = np.vstack([X[:split, :], X[2000+train_num:, :]])
+        y_pred = model.predict(X_test)
 
-        false_1 = np.count_nonzero(y_pred_0 == 1)
-        false_0 = np.count_nonzero(y_pred_1 == 0)
+        false_1 = np.count_nonzero(y_pred[:split] == 1)
+        false_0 = np.count_nonzero(y_pred[split:] == 0)
 
         wrong_count = false_1 + false_0
 
         print("inaccuracy on external data:", (wrong_count)/(test_num*2) )
 
-    sk_snippet = generate_sklearn_loader_snippet(model, compression='zlib')
+    sk_snippet = generate_sklearn_loader_snippet(
+        model, compression='zlib', compact_logistic=True
+    )
     print(sk_snippet)
 
     model = get_model()
     print("inaccuracy on training data after reconstruction:", 1-model.score(X,y))
 
-    
-
-training_model()
-
-
 
 def test_model():
+    import pandas as pd
+
     model = get_model()
     CIPHERTEXT_PATH = "data/cipher_objective.csv"
     CIPHER_TEXT_PAIRS =  pd.read_csv(CIPHERTEXT_PATH).values.tolist()
@@ -95,12 +102,14 @@ def test_model():
     test_message = CIPHER_TEXT_PAIRS[0][0]
     print(test_message)
     
-    X = np.zeros((1,100))
-
-    for i in range(100):
-        X[0,i] = ord(test_message[i])
+    buf = test_message[:100].encode("utf-32-le", errors="surrogatepass")
+    X = np.frombuffer(buf, dtype="<u4").reshape(1, 100).astype(np.float64)
 
     result = model.predict(X)
     print(result)
 
-# test_model()
\ No newline at end of file
+# test_model()
+
+
+if __name__ == "__main__":
+    training_model()
\ No newline at end of file
@@ -5,7 +5,8 @@ and can be pasted into another file to reconstruct the model.
 
 Features:
 - Strong typing and clear APIs.
-- Optional compression for smaller embedded payloads (zlib, gzip, bz2, lzma, none).
+- Optional compression for smaller embedded payloads (zlib, gzip, bz2, lzma, zstd, none);
+  zstd requires the optional zstandard package and falls back to zlib without it.
 - For scikit-learn: uses pickle-compatible bytes (cloudpickle for dumping if available).
 - For PyTorch: prefers TorchScript (self-contained), then full-model pickle with
   PyTorch>=2.6 handling, then state_dict fallback.
@@ -24,11 +25,18 @@ Usage (brief):
 
 from __future__ import annotations
 
+import ast
 import base64
+import bz2
+import functools
+import hashlib
 import io
 import inspect
+import lzma
 import pickle
-from typing import Any, Literal, Optional
+import weakref
+import zlib
+from typing import Any, Callable, Literal, Optional
 
 # Optional imports only used when generating PyTorch snippets (runtime still needs torch)
 try:
@@ -38,8 +46,21 @@ except Exception:  # pragma: no cover
     torch = None  # type: ignore
     nn = None     # type: ignore
 
-Compression = Literal["zlib", "gzip", "bz2", "lzma", "none"]
+# Optional zstd support; generated snippets then need zstandard at load time too
+try:
+    import zstandard
+except Exception:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+# Optional SIMD base64 encoder for large payloads; output is identical to the stdlib's
+try:
+    from pybase64 import b64encode as _b64encode
+except Exception:  # pragma: no cover
+    _b64encode = base64.b64encode
+
+Compression = Literal["zlib", "gzip", "bz2", "lzma", "zstd", "none"]
 TorchScriptMode = Literal["auto", "script", "trace"]
+Quantize = Literal["none", "fp16", "bf16", "int8"]
 
 
 # =========================
@@ -51,6 +72,56 @@ def _normalize_torchscript_mode(mode: TorchScriptMode) -> TorchScriptMode:
     return m if m in {"auto", "script", "trace"} else "auto"
 
 
+class _NoCompress:
+    """Pass-through with the compressobj interface, for compression="none"."""
+
+    def compress(self, data: Any) -> bytes:
+        return bytes(data)
+
+    def flush(self) -> bytes:
+        return b""
+
+
+# compression name -> (compressobj factory(level), decompressor setup code for the snippet).
+# Every factory returns an object with compress(data) -> bytes and flush() -> bytes, so
+# payloads can be compressed either in one shot or as a stream (see _CompressingWriter).
+_COMPRESSORS: dict[str, tuple[Callable[[int], Any], str]] = {
+    "zlib": (
+        lambda level: zlib.compressobj(level),
+        "import zlib as _z; _decomp = _z.decompress",
+    ),
+    "gzip": (
+        lambda level: zlib.compressobj(level, zlib.DEFLATED, 31),  # wbits=31: gzip container
+        "import gzip as _gz, io as _io; _decomp = lambda b: _gz.GzipFile(fileobj=_io.BytesIO(b), mode='rb').read()",
+    ),
+    "bz2": (
+        lambda level: bz2.BZ2Compressor(min(max(level, 1), 9)),
+        "import bz2 as _bz2; _decomp = _bz2.decompress",
+    ),
+    "lzma": (
+        lambda level: lzma.LZMACompressor(preset=min(max(level, 0), 9)),
+        "import lzma as _lz; _decomp = _lz.decompress",
+    ),
+    "none": (
+        lambda level: _NoCompress(),
+        "_decomp = (lambda b: b)",
+    ),
+}
+if zstandard is not None:
+    # Streamed frames carry no content size, so the snippet decompresses via decompressobj
+    _COMPRESSORS["zstd"] = (
+        lambda level: zstandard.ZstdCompressor(
+            level=min(max(level, 1), 22), threads=-1
+        ).compressobj(),
+        "import zstandard as _zs; _decomp = lambda b: _zs.ZstdDecompressor().decompressobj().decompress(b)",
+    )
+
+
+def _normalize_compression(compression: Compression) -> str:
+    comp = (compression or "zlib").lower()
+    return comp if comp in _COMPRESSORS else "zlib"  # unknown, or zstd without zstandard
+
+
 def _compress_to_b64(data: bytes, compression: Compression, level: int) -> tuple[str, str, str]:
     """
     Compress bytes and return:
@@ -58,39 +129,54 @@ def _compress_to_b64(data: bytes, compression: Compression, level: int) -> tuple
       - decomp_loader_code: Python code for the generated snippet to decompress
       - comp_name: normalized compression name
     """
-    comp = (compression or "zlib").lower()
-    if comp not in {"zlib", "gzip", "bz2", "lzma", "none"}:
-        comp = "zlib"
-
-    if comp == "zlib":
-        import zlib
-        raw = zlib.compress(data, level=level)
-        decomp_code = "import zlib as _z; _decomp = _z.decompress"
-    elif comp == "gzip":
-        import gzip
-        buf = io.BytesIO()
-        with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=level) as f:
-            f.write(data)
-        raw = buf.getvalue()
-        decomp_code = "import gzip as _gz, io as _io; _decomp = lambda b: _gz.GzipFile(fileobj=_io.BytesIO(b), mode='rb').read()"
-    elif comp == "bz2":
-        import bz2
-        lvl = min(max(level, 1), 9)
-        raw = bz2.compress(data, compresslevel=lvl)
-        decomp_code = "import bz2 as _bz2; _decomp = _bz2.decompress"
-    elif comp == "lzma":
-        import lzma
-        raw = lzma.compress(data, preset=min(max(level, 0), 9))
-        decomp_code = "import lzma as _lz; _decomp = _lz.decompress"
-    else:  # none
-        raw = data
-        decomp_code = "_decomp = (lambda b: b)"
-
-    b64 = base64.b64encode(raw).decode("ascii")
+    comp = _normalize_compression(compression)
+    factory, decomp_code = _COMPRESSORS[comp]
+    compressor = factory(level)
+    compressed = compressor.compress(data) + compressor.flush()
+    b64 = _b64encode(compressed).decode("ascii")
+    return b64, decomp_code, comp
+
+
+class _CompressingWriter(io.RawIOBase):
+    """Write-only file object that compresses everything written to it."""
+
+    def __init__(self, compressor: Any) -> None:
+        super().__init__()
+        self._compressor = compressor
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        view = memoryview(b)
+        chunk = self._compressor.compress(view)
+        if chunk:
+            self._chunks.append(chunk)
+        return view.nbytes
+
+    def finish(self) -> bytes:
+        """Flush the compressor and return the complete compressed payload."""
+        self._chunks.append(self._compressor.flush())
+        return b"".join(self._chunks)
+
+
+def _save_to_b64(obj: Any, compression: Compression, level: int) -> tuple[str, str, str]:
+    """
+    Like _compress_to_b64(torch.save(obj)), but torch.save streams straight into the
+    compressor, so the uncompressed payload is never held in memory.
+    """
+    comp = _normalize_compression(compression)
+    factory, decomp_code = _COMPRESSORS[comp]
+    writer = _CompressingWriter(factory(level))
+    torch.save(obj, writer, pickle_protocol=5)
+    b64 = _b64encode(writer.finish()).decode("ascii")
     return b64, decomp_code, comp
 
 
+@functools.cache
 def _has_noarg_constructor(cls: type) -> bool:
+    # Signatures are fixed per class, so inspect each class once.
     try:
         sig = inspect.signature(cls)
         params = list(sig.parameters.values())[1:]  # skip self
@@ -106,10 +192,67 @@ def _has_noarg_constructor(cls: type) -> bool:
 # Scikit-learn generator
 # =========================
 
+def _logistic_regression_loader_snippet(
+    model: Any,
+    compression: Compression,
+    level: int,
+) -> Optional[str]:
+    """
+    Return a pickle-free get_model() for a fitted LogisticRegression, or None.
+
+    Only coef_, intercept_ and classes_ are needed to predict, so they are packed
+    as one float64 buffer and rebuilt with np.frombuffer; the hyperparameters are
+    emitted as literals. Anything else (other estimators, unfitted models, models
+    fitted on named features) returns None so the caller falls back to pickle.
+    """
+    cls = type(model)
+    if cls.__name__ != "LogisticRegression" or not cls.__module__.startswith("sklearn.linear_model"):
+        return None
+    if not hasattr(model, "coef_") or hasattr(model, "feature_names_in_"):
+        return None
+
+    import numpy as np
+
+    coef = np.asarray(model.coef_, dtype=np.float64)
+    intercept = np.asarray(model.intercept_, dtype=np.float64)
+    classes = np.asarray(model.classes_)
+    params = model.get_params()
+    try:
+        # Hyperparameters must round-trip through repr to be embedded as code.
+        if ast.literal_eval(repr(params)) != params:
+            return None
+    except Exception:
+        return None
+
+    blob = np.concatenate([coef.ravel(), intercept.ravel()]).tobytes()
+    b64, decomp_code, comp_name = _compress_to_b64(blob, compression, level)
+    n_coef = coef.size
+
+    return f'''\
+def get_model():
+    """
+    Reconstruct and return a scikit-learn LogisticRegression from embedded, base64-encoded {'compressed ' if comp_name!='none' else ''}float64 weights.
+    """
+    import base64
+    import numpy as np
+    from sklearn.linear_model import LogisticRegression
+    {decomp_code}
+    _blob_b64 = "{b64}"
+    _arr = np.frombuffer(_decomp(base64.b64decode(_blob_b64)), dtype=np.float64)
+    model = LogisticRegression(**{params!r})
+    model.coef_ = _arr[:{n_coef}].reshape({coef.shape!r})
+    model.intercept_ = _arr[{n_coef}:]
+    model.classes_ = np.array({classes.tolist()!r}, dtype={classes.dtype.str!r})
+    model.n_features_in_ = {coef.shape[1]}
+    return model
+'''
+
+
 def generate_sklearn_loader_snippet(
     model: Any,
     compression: Compression = "zlib",
     level: int = 9,
+    compact_logistic: bool = False,
 ) -> str:
     """
     Create a copy-pasteable get_model() code string that reconstructs the given
@@ -117,8 +260,12 @@ def generate_sklearn_loader_snippet(
 
     Args:
         model: An instantiated scikit-learn object (instance, not a class).
-        compression: Compression algorithm ("zlib", "gzip", "bz2", "lzma", "none").
-        level: Compression level (zlib/gzip/bz2; lzma uses preset; ignored for none).
+        compression: Compression algorithm ("zlib", "gzip", "bz2", "lzma", "zstd", "none").
+        level: Compression level (zlib/gzip/bz2/zstd; lzma uses preset; ignored for none).
+        compact_logistic: If True, a fitted LogisticRegression is emitted as raw
+            weights plus hyperparameters instead of a pickle. The result is smaller
+            but only restores what predict/predict_proba/decision_function need
+            (e.g. n_iter_ is dropped). Other models always use pickle.
 
     Returns:
         Python source string defining get_model().
@@ -132,6 +279,12 @@ def generate_sklearn_loader_snippet(
     if isinstance(model, type):
         raise TypeError("Expected an instantiated scikit-learn model (instance), not a class.")
 
+    # Fitted logistic regressions only need their weights; skip pickle entirely.
+    if compact_logistic:
+        specialized = _logistic_regression_loader_snippet(model, compression, level)
+        if specialized is not None:
+            return specialized
+
     # Serialize with cloudpickle if available, else pickle.
     try:
         import cloudpickle as _cp  # type: ignore
@@ -171,6 +324,8 @@ def generate_torch_loader_snippet(
     prefer: TorchScriptMode = "auto",
     compression: Compression = "zlib",
     level: int = 9,
+    quantize: Quantize = "none",
+    freeze: bool = False,
 ) -> str:
     """
     Create a copy-pasteable get_model() code string that reconstructs the given PyTorch model.
@@ -191,6 +346,13 @@ def generate_torch_loader_snippet(
         prefer: "auto", "script", or "trace".
         compression: Compression algorithm.
         level: Compression level.
+        quantize: Store floating tensors of the state_dict fallback as "fp16"/"bf16"
+            (half the bytes) or per-tensor scaled "int8" (a quarter); the loader
+            restores the original dtype. Lossy; "none" embeds them unchanged.
+            Tensors holding inf/NaN are kept unquantized under "int8".
+        freeze: Run torch.jit.freeze on the TorchScript module before saving, inlining
+            parameters as constants (smaller, faster graph). The loader's dtype argument
+            then has no parameters left to convert, hence off by default.
 
     Returns:
         Python source string defining get_model(device="cpu", dtype=None).
@@ -212,69 +374,210 @@ def generate_torch_loader_snippet(
     mode = _normalize_torchscript_mode(prefer)
 
     # 1) TorchScript attempt (script, then trace if allowed and example provided)
-    ts_bytes = _dump_torchscript_bytes(model, mode, example_inputs)
+    ts_bytes = _dump_torchscript_bytes(model, mode, example_inputs, freeze)
     if ts_bytes is not None:
         b64, decomp_code, comp_name = _compress_to_b64(ts_bytes, compression, level)
         return _render_torchscript_loader(b64, decomp_code, comp_name)
 
     # 2) Full model pickle
-    full_bytes = _dump_full_pickle_bytes(model)
-    if full_bytes is not None:
-        b64, decomp_code, comp_name = _compress_to_b64(full_bytes, compression, level)
+    full = _dump_full_pickle_b64(model, compression, level)
+    if full is not None:
+        b64, decomp_code, comp_name = full
         module_name = model.__class__.__module__
         class_name = model.__class__.__name__
         return _render_full_pickle_loader(b64, decomp_code, comp_name, module_name, class_name)
 
     # 3) state_dict fallback
-    sd_bytes = _dump_state_dict_bytes(model)
-    b64, decomp_code, comp_name = _compress_to_b64(sd_bytes, compression, level)
+    b64, decomp_code, comp_name = _dump_state_dict_b64(model, quantize, compression, level)
     zero_arg_ok = _has_noarg_constructor(model.__class__)
     module_name = model.__class__.__module__
     class_name = model.__class__.__name__
-    return _render_state_dict_loader(b64, decomp_code, comp_name, module_name, class_name, zero_arg_ok)
+    return _render_state_dict_loader(
+        b64, decomp_code, comp_name, module_name, class_name, zero_arg_ok, quantize
+    )
 
 
 
 # ----- PyTorch generator internals -----
 
-def _dump_torchscript_bytes(
+# model -> (fingerprint, compiled ScriptModule). Scripting dominates generation time, so
+# variants differing only in compression/quantize/freeze reuse the compiled module while
+# the fingerprint still matches; entries go away with the model.
+_SCRIPT_CACHE: "weakref.WeakKeyDictionary[nn.Module, tuple[bytes, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _hash_value(h: "hashlib._Hash", value: Any) -> None:
+    """Feed a tensor (dtype, shape, raw bytes) or nested inputs into ``h``."""
+    if isinstance(value, torch.Tensor):
+        t = value.detach().cpu().contiguous()
+        h.update(f"{t.dtype}{tuple(t.shape)}".encode())
+        h.update(t.reshape(-1).view(torch.uint8).numpy())
+    elif isinstance(value, (tuple, list)):
+        h.update(f"{type(value).__name__}{len(value)}".encode())
+        for v in value:
+            _hash_value(h, v)
+    elif isinstance(value, dict):
+        h.update(f"dict{len(value)}".encode())
+        for k, v in value.items():
+            h.update(repr(k).encode())
+            _hash_value(h, v)
+    else:
+        h.update(repr(value).encode())
+
+
+def _is_plain(value: Any) -> bool:
+    """True for data whose whole content _hash_value captures (no opaque objects)."""
+    if isinstance(value, (bool, int, float, complex, str, bytes, type(None))):
+        return True
+    if isinstance(value, (torch.Tensor, torch.dtype, torch.device)):
+        return True
+    if isinstance(value, (tuple, list)):
+        return all(_is_plain(v) for v in value)
+    if isinstance(value, dict):
+        return all(_is_plain(k) and _is_plain(v) for k, v in value.items())
+    return False
+
+
+def _model_fingerprint(
     model: "nn.Module",
     mode: TorchScriptMode,
     example_inputs: Optional[Any],
 ) -> Optional[bytes]:
+    """
+    Content hash of the model state the generated snippet captures: the source of
+    every module class, the state_dict (names, dtypes, shapes, bytes), buffers
+    missing from it (persistent=False), every public attribute of every submodule
+    (flags, config scalars, tensors stored as plain attributes), the TorchScript
+    mode and the example inputs.
+    Returns None when any part cannot be hashed, which disables caching. That
+    includes public attributes holding anything other than plain data, since
+    their content could change without changing the hash.
+    """
+    try:
+        h = hashlib.blake2b(digest_size=32)
+        h.update(mode.encode())
+        for cls in dict.fromkeys(type(m) for m in model.modules()):
+            h.update(f"{cls.__module__}.{cls.__qualname__}".encode())
+            try:
+                h.update(inspect.getsource(cls).encode())
+            except (OSError, TypeError):
+                pass  # class defined interactively; weights and name still count
+        sd = model.state_dict()
+        for name, tensor in sd.items():
+            h.update(name.encode())
+            _hash_value(h, tensor)
+        for name, buf in model.named_buffers():
+            if name not in sd:
+                h.update(name.encode())
+                _hash_value(h, buf)
+        for mod_name, m in model.named_modules():
+            for attr, value in vars(m).items():
+                if attr.startswith("_"):
+                    continue  # nn.Module internals; parameters/buffers are hashed above
+                if not _is_plain(value):
+                    return None
+                h.update(f"{mod_name}.{attr}".encode())
+                _hash_value(h, value)
+        _hash_value(h, example_inputs)
+        return h.digest()
+    except Exception:
+        return None
+
+
+def _script_or_trace(
+    model: "nn.Module",
+    mode: TorchScriptMode,
+    example_inputs: Optional[Any],
+) -> Optional[Any]:
+    was_training = model.training
     try:
-        model_eval = model.eval()
+        model.eval()
         with torch.no_grad():
             if mode == "trace":
                 if example_inputs is None:
                     return None
-                ts = torch.jit.trace(model_eval, example_inputs, strict=False)
-            else:
-                try:
-                    ts = torch.jit.script(model_eval)
-                except Exception:
-                    if mode == "auto" and example_inputs is not None:
-                        ts = torch.jit.trace(model_eval, example_inputs, strict=False)
-                    else:
-                        return None
+                return torch.jit.trace(model, example_inputs, strict=False)
+            try:
+                return torch.jit.script(model)
+            except Exception:
+                if mode == "auto" and example_inputs is not None:
+                    return torch.jit.trace(model, example_inputs, strict=False)
+                return None
+    finally:
+        model.train(was_training)  # the scripted copy stays in eval mode
+
+
+def _dump_torchscript_bytes(
+    model: "nn.Module",
+    mode: TorchScriptMode,
+    example_inputs: Optional[Any],
+    freeze: bool = False,
+) -> Optional[bytes]:
+    try:
+        fingerprint = _model_fingerprint(model, mode, example_inputs)
+        cached = _SCRIPT_CACHE.get(model)
+        if fingerprint is not None and cached is not None and cached[0] == fingerprint:
+            ts = cached[1]
+        else:
+            ts = _script_or_trace(model, mode, example_inputs)
+            if ts is None:
+                return None
+            if fingerprint is not None:
+                _SCRIPT_CACHE[model] = (fingerprint, ts)
+        if freeze:
+            try:
+                ts = torch.jit.freeze(ts)  # returns a frozen copy; the cached module is untouched
+            except Exception:
+                pass  # e.g. mutated attributes; keep the unfrozen module
         return ts.save_to_buffer()
     except Exception:
         return None
 
 
-def _dump_full_pickle_bytes(model: "nn.Module") -> Optional[bytes]:
+def _dump_full_pickle_b64(
+    model: "nn.Module",
+    compression: Compression,
+    level: int,
+) -> Optional[tuple[str, str, str]]:
     try:
-        buf = io.BytesIO()
-        torch.save(model, buf)
-        return buf.getvalue()
+        return _save_to_b64(model, compression, level)
     except Exception:
         return None
 
 
-def _dump_state_dict_bytes(model: "nn.Module") -> bytes:
-    buf = io.BytesIO()
-    torch.save(model.state_dict(), buf)
-    return buf.getvalue()
+def _quantize_tensor(t: "torch.Tensor", quantize: Quantize) -> Any:
+    """
+    Shrink a floating tensor; int8 yields a (q, scale) pair, scale in the original dtype.
+
+    A tensor with inf/NaN has no usable int8 scale, so it is returned unchanged and
+    the loader passes it through as-is.
+    """
+    if quantize == "none" or not t.is_floating_point():
+        return t
+    if quantize == "fp16":
+        return t.to(torch.float16)
+    if quantize == "bf16":
+        return t.to(torch.bfloat16)
+    if not bool(torch.isfinite(t).all()):
+        return t
+    amax = t.detach().abs().max() if t.numel() else t.new_zeros(())
+    scale = amax / 127 if amax > 0 else torch.ones((), dtype=t.dtype)
+    q = (t.detach() / scale).round().clamp(-127, 127).to(torch.int8)
+    return (q, scale.to(t.dtype))
+
+
+def _dump_state_dict_b64(
+    model: "nn.Module",
+    quantize: Quantize,
+    compression: Compression,
+    level: int,
+) -> tuple[str, str, str]:
+    sd: Any = model.state_dict()
+    if quantize != "none":
+        sd = {k: _quantize_tensor(v, quantize) for k, v in sd.items()}
+    return _save_to_b64(sd, compression, level)
 
 
 def _render_torchscript_loader(b64: str, decomp_code: str, comp_name: str) -> str:
@@ -305,12 +608,17 @@ def get_model(device: str = "cpu", dtype: str | None = None):
 '''
 
 
+# Decompressed full-pickle payloads above this size are memory-mapped by the loader
+_MMAP_THRESHOLD = 128 * 1024 * 1024
+
+
 def _render_full_pickle_loader(
     b64: str,
     decomp_code: str,
     comp_name: str,
     module_name: str,
     class_name: str,
+    mmap_threshold: int = _MMAP_THRESHOLD,
 ) -> str:
     return f'''\
 def get_model(device: str = "cpu", dtype: str | None = None):
@@ -323,6 +631,11 @@ def get_model(device: str = "cpu", dtype: str | None = None):
         This loader will:
           1) Try to import the class and allowlist it via torch.serialization.safe_globals.
           2) Fall back to weights_only=False (ONLY if you trust this source).
+      - Payloads over {mmap_threshold} bytes are written to a temporary file and
+        memory-mapped (torch.load(mmap=True)) instead of copied into memory. The file
+        is deleted as soon as loading finishes or fails; where the OS refuses while
+        the mapping is open (Windows), deletion is retried at interpreter exit.
+        A process killed during loading can leave the file in the temp directory.
 
     Args:
         device: Where to map the model (e.g., "cpu", "cuda:0").
@@ -340,17 +653,43 @@ def get_model(device: str = "cpu", dtype: str | None = None):
     except Exception:
         cls = None
 
-    # Attempt safe load first
+    _tmp_path = None
     try:
-        if cls is not None:
-            with torch.serialization.safe_globals([cls]):
-                m = torch.load(io.BytesIO(_raw), map_location=device)
+        # Large payloads are memory-mapped from a temp file instead of copied into tensors
+        if len(_raw) > {mmap_threshold}:
+            import tempfile
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".pt") as f:
+                _tmp_path = f.name
+                f.write(_raw)
+            del _raw
+            _src, _kw = (lambda: _tmp_path), {{"mmap": True}}
         else:
-            # Class not importable; last resort: trusted load
-            m = torch.load(io.BytesIO(_raw), map_location=device, weights_only=False)
-    except Exception:
-        # Final fallback: trusted load
-        m = torch.load(io.BytesIO(_raw), map_location=device, weights_only=False)
+            _src, _kw = (lambda: io.BytesIO(_raw)), {{}}
+
+        # Attempt safe load first
+        try:
+            if cls is not None:
+                with torch.serialization.safe_globals([cls]):
+                    m = torch.load(_src(), map_location=device, **_kw)
+            else:
+                # Class not importable; last resort: trusted load
+                m = torch.load(_src(), map_location=device, **_kw, weights_only=False)
+        except Exception:
+            # Final fallback: trusted load
+            m = torch.load(_src(), map_location=device, **_kw, weights_only=False)
+    finally:
+        if _tmp_path is not None:
+            # Mapped pages stay valid after unlinking on POSIX
+            import atexit, os
+            try:
+                os.unlink(_tmp_path)
+            except OSError:
+                def _unlink_quietly(path):
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                atexit.register(_unlink_quietly, _tmp_path)
 
     if dtype is not None:
         dt = getattr(torch, dtype) if isinstance(dtype, str) else dtype
@@ -367,8 +706,15 @@ def _render_state_dict_loader(
     module_name: str,
     class_name: str,
     zero_arg_ok: bool,
+    quantize: Quantize = "none",
 ) -> str:
     ctor = f"{class_name}()" if zero_arg_ok else f"{class_name}(# TODO: fill constructor args)"
+    # fp16/bf16 tensors are cast back by load_state_dict's copy; int8 needs its scale
+    dequant = (
+        "\n    sd = {k: v[0].to(v[1].dtype) * v[1] if isinstance(v, tuple) else v for k, v in sd.items()}"
+        if quantize == "int8"
+        else ""
+    )
     return f'''\
 def get_model(device: str = "cpu", dtype: str | None = None):
     """
@@ -388,7 +734,9 @@ def get_model(device: str = "cpu", dtype: str | None = None):
     mod = importlib.import_module("{module_name}")
     cls = getattr(mod, "{class_name}")
     model = {ctor}
-    sd = torch.load(io.BytesIO(_decomp(base64.b64decode("{b64}"))), map_location=device)
+    sd = torch.load(
+        io.BytesIO(_decomp(base64.b64decode("{b64}"))), map_location=device, weights_only=True
+    ){dequant}
     missing, unexpected = model.load_state_dict(sd, strict=False)
     if missing or unexpected:
         print("Warning: load_state_dict mismatches. Missing:", missing, "Unexpected:", unexpected)
@@ -428,6 +776,7 @@ def show_images_interactive(
     cmap: Optional[str] = None,
     figsize: Tuple[float, float] = (6.0, 5.0),
     hide_toolbar: bool = True,
+    downsample: bool = False,
 ) -> MatplotlibImageBrowser:
     """
     Interactively browse images using Matplotlib Slider/Buttons (no ipywidgets).
@@ -441,6 +790,9 @@ def show_images_interactive(
     - cmap: optional matplotlib colormap (e.g., 'gray')
     - figsize: figure size
     - hide_toolbar: hides the Matplotlib navigation toolbar if supported
+    - downsample: shrink images larger than twice the image axes' pixel size
+      (at least 512 px) before display. Faster browsing of very large images,
+      but lossy: zooming in with the toolbar shows the reduced resolution
 
     Returns:
     - MatplotlibImageBrowser with references to keep controls alive
@@ -451,14 +803,22 @@ def show_images_interactive(
         if isinstance(x, np.ndarray):
             arr = x
             if arr.dtype != np.uint8:
-                arr = np.nan_to_num(arr, copy=True)
-                arr_min = float(arr.min())
-                arr_max = float(arr.max())
+                # Min-max scale to 0..255 in one buffer, updated in place. Floats keep
+                # their dtype and integers widen to float64, as the out-of-place
+                # arithmetic did, so narrow ranges keep their precision
+                is_float = np.issubdtype(arr.dtype, np.floating)
+                work_dtype = arr.dtype if is_float else np.float64
+                buf = np.nan_to_num(arr.astype(work_dtype), copy=False)
+                arr_min = float(buf.min())
+                arr_max = float(buf.max())
                 if arr_max > arr_min:
-                    arr = (arr - arr_min) / (arr_max - arr_min)
+                    buf -= arr_min
+                    buf /= arr_max - arr_min
+                    buf *= 255.0
+                    np.clip(buf, 0, 255, out=buf)
                 else:
-                    arr = np.zeros_like(arr, dtype=np.float32)
-                arr = (arr * 255.0).clip(0, 255).astype(np.uint8)
+                    buf.fill(0)
+                arr = buf.astype(np.uint8)
             if arr.ndim == 2:
                 return Image.fromarray(arr, mode="L")
             if arr.ndim == 3:
@@ -473,8 +833,7 @@ def show_images_interactive(
             return Image.open(x)
         raise TypeError(f"Unsupported image type: {type(x)}")
 
-    pil_images: List[Image.Image] = [to_pil(img) for img in images]
-    n = len(pil_images)
+    n = len(images)
     if n == 0:
         raise ValueError("No images provided.")
     if titles is None:
@@ -504,8 +863,25 @@ def show_images_interactive(
     ax_prev = fig.add_axes(prev_rect)
     ax_next = fig.add_axes(next_rect)
 
+    # Largest useful frame: the image axes in pixels, doubled for HiDPI screens
+    max_size = (
+        max(int(img_rect[2] * figsize[0] * fig.dpi * 2), 512),
+        max(int(img_rect[3] * figsize[1] * fig.dpi * 2), 512),
+    )
+
+    # Decode on first display instead of up front; keep the most recent frames around
+    # as ready-to-draw arrays so revisiting an image skips PIL entirely
+    @functools.lru_cache(maxsize=8)
+    def load_image(i: int) -> np.ndarray:
+        img = to_pil(images[i])
+        if downsample and (img.size[0] > max_size[0] or img.size[1] > max_size[1]):
+            if img is images[i]:
+                img = img.copy()  # thumbnail() resizes in place; leave the caller's image alone
+            img.thumbnail(max_size, Image.BILINEAR)
+        return np.asarray(img)
+
     current_idx = 0
-    arr0 = np.asarray(pil_images[current_idx])
+    arr0 = load_image(current_idx)
     im_artist = ax_img.imshow(arr0, cmap=cmap)
     ax_img.set_title(titles[current_idx], fontdict={"fontsize": 12})
     ax_img.axis("off")
@@ -515,14 +891,18 @@ def show_images_interactive(
     btn_prev = Button(ax_prev, label="Prev")
     btn_next = Button(ax_next, label="Next")
 
+    last_shape = arr0.shape[:2]
+
     def update_index(new_idx: int) -> None:
-        nonlocal current_idx
+        nonlocal current_idx, last_shape
         current_idx = int(np.clip(new_idx, 0, n - 1))
-        img = pil_images[current_idx]
-        im_artist.set_data(np.asarray(img))
+        arr = load_image(current_idx)
+        im_artist.set_data(arr)
         ax_img.set_title(titles[current_idx])
-        ax_img.set_xlim(0, img.size[0])
-        ax_img.set_ylim(img.size[1], 0)
+        if arr.shape[:2] != last_shape:  # re-limiting invalidates the axes transforms
+            last_shape = arr.shape[:2]
+            ax_img.set_xlim(0, last_shape[1])
+            ax_img.set_ylim(last_shape[0], 0)
         fig.canvas.draw_idle()
 
     def on_slider_change(val: float) -> None:
@@ -547,7 +927,6 @@ def show_images_interactive(
 # ---
 
 
-from typing import Callable
 from grid_universe.state import State
 from grid_universe.step import step
 from grid_universe.actions import Action
@@ -557,9 +936,18 @@ def get_level_name(builder: Callable[[], State]) -> str:
     return f"Level {' '.join(builder.__name__.split('_')[2:])}"
 
 
+@functools.cache
 def get_minimum_total_reward(builder: Callable[[], State]) -> int:
+    """
+    Score of a level when the agent only ever waits.
+
+    Builders are deterministic, so results are cached per builder for the life of the
+    process. Only pass module-level builder functions: each closure or lambda gets its
+    own cache entry, and the cache keeps every builder passed in alive.
+    """
     state = builder()
     assert state.turn_limit is not None
+    _step, wait = step, Action.WAIT
     while not (state.win or state.lose):
-        state = step(state, Action.WAIT)
+        state = _step(state, wait)
     return state.score
\ No newline at end of file